@@ -88,6 +88,16 @@ async def get_ingestion_pipeline() -> MultiModalIngestionPipeline:
     return _ingestion_pipeline
 
 
+def close_ingestion_pipeline() -> None:
+    """Shut down the ingestion pipeline's worker pool, if the pipeline was created"""
+    global _ingestion_pipeline
+    
+    if _ingestion_pipeline:
+        _ingestion_pipeline.close()
+        _ingestion_pipeline = None
+        logger.info("Ingestion pipeline closed")
+
+
 # Request/Response models
 class ChatRequest(BaseModel):
     """Chat request model"""
@@ -20,6 +20,7 @@ class Settings(BaseSettings):
     # API
     api_host: str = Field(default="0.0.0.0", env="API_HOST")
     api_port: int = Field(default=8058, env="API_PORT")
+    api_workers: int = Field(default=1, env="API_WORKERS")
     api_prefix: str = "/api/v1"
     
     # Database URLs (using Docker service names)
@@ -84,6 +85,8 @@ class Settings(BaseSettings):
     ingestion_chunk_overlap: int = 200
     ingestion_batch_size: int = 10
     ingestion_max_concurrent: int = 5
+    excel_cache_dir: Optional[str] = Field(default=None, env="EXCEL_CACHE_DIR")  # None = no caching
+    excel_cache_max_mb: int = Field(default=256, env="EXCEL_CACHE_MAX_MB")
     
     # Monitoring
     enable_metrics: bool = True
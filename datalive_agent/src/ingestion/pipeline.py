@@ -4,19 +4,19 @@ Processes documents from various sources and formats into vector DB and knowledg
 """
 
 import asyncio
+import importlib
 import logging
-from typing import Dict, List, Any, Optional, Union
+import multiprocessing
+import os
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Union, Tuple
 from datetime import datetime
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 import hashlib
 
-from .processors.pdf_processor import PDFProcessor
-from .processors.excel_processor import ExcelProcessor
-from .processors.txt_processor import TXTProcessor
-from .processors.markdown_processor import MarkdownProcessor
-from .processors.csv_processor import CSVProcessor
 from .extractors.entity_extractor import EntityExtractor
 from .extractors.relationship_extractor import RelationshipExtractor
 from ..core.vector_store import VectorStore
@@ -30,6 +30,59 @@ from ..core.metrics import (
 
 logger = logging.getLogger(__name__)
 
+# Processor classes by source type, as (module, class name). Modules are
+# imported on first use so API-only processes never load pandas, PyMuPDF,
+# pdfplumber and the other parsing libraries.
+_PROCESSOR_CLASSES = {
+    'pdf': ('.processors.pdf_processor', 'PDFProcessor'),
+    'excel': ('.processors.excel_processor', 'ExcelProcessor'),
+    'txt': ('.processors.txt_processor', 'TXTProcessor'),
+    'markdown': ('.processors.markdown_processor', 'MarkdownProcessor'),
+    'csv': ('.processors.csv_processor', 'CSVProcessor')
+}
+
+
+class ProcessorRegistry(Mapping):
+    """Read-only mapping of source type to processor, importing and creating each on first access"""
+    
+    def __init__(
+        self,
+        processor_classes: Dict[str, Tuple[str, str]],
+        executor: Optional[Executor] = None,
+        executor_workers: int = 1
+    ):
+        self._processor_classes = processor_classes
+        self._executor = executor
+        self._executor_workers = executor_workers
+        self._instances: Dict[str, Any] = {}
+    
+    def __getitem__(self, source_type: str):
+        processor = self._instances.get(source_type)
+        if processor is None:
+            module_name, class_name = self._processor_classes[source_type]
+            module = importlib.import_module(module_name, __package__)
+            processor = self._instances[source_type] = getattr(module, class_name)()
+            processor.executor = self._executor
+            processor.executor_workers = self._executor_workers
+        return processor
+    
+    def __contains__(self, source_type) -> bool:
+        # Mapping's default would import the processor just to test membership
+        return source_type in self._processor_classes
+    
+    def __iter__(self):
+        return iter(self._processor_classes)
+    
+    def __len__(self) -> int:
+        return len(self._processor_classes)
+    
+    def close(self) -> None:
+        """Close the processors created so far that hold resources"""
+        for processor in self._instances.values():
+            close = getattr(processor, 'close', None)
+            if close is not None:
+                close()
+
 
 class DocumentMetadata(BaseModel):
     """Document metadata model"""
@@ -70,6 +123,8 @@ class IngestionConfig(BaseModel):
     enable_temporal_analysis: bool = True
     batch_size: int = 10
     max_concurrent_docs: int = 5
+    # Size of the process pool shared by the processors; below 2 parsing stays in-process
+    worker_processes: int = min(4, os.cpu_count() or 1)
 
 
 class MultiModalIngestionPipeline:
@@ -88,14 +143,20 @@ class MultiModalIngestionPipeline:
         self.knowledge_graph = knowledge_graph
         self.config = config or IngestionConfig()
         
-        # Initialize processors
-        self.processors = {
-            'pdf': PDFProcessor(),
-            'excel': ExcelProcessor(),
-            'txt': TXTProcessor(),
-            'markdown': MarkdownProcessor(),
-            'csv': CSVProcessor()
-        }
+        # One bounded process pool for CPU-bound parsing, shared by all processors.
+        # Workers are spawned on first use, and spawned rather than forked because
+        # the event loop process runs threads.
+        self.executor = None
+        if self.config.worker_processes > 1:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.config.worker_processes,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        
+        # Processors are created on first use of their source type
+        self.processors = ProcessorRegistry(
+            _PROCESSOR_CLASSES, self.executor, self.config.worker_processes
+        )
         
         # Initialize extractors
         self.entity_extractor = EntityExtractor()
@@ -480,6 +541,13 @@ class MultiModalIngestionPipeline:
             logger.error(f"Error storing document {document.id} in knowledge graph: {e}")
             document.errors.append(f"Knowledge graph storage error: {str(e)}")
 
+    def close(self) -> None:
+        """Close the processors and shut down their worker pool; pending parses are cancelled"""
+        self.processors.close()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
     async def get_processing_stats(self) -> Dict[str, Any]:
         """Get processing statistics"""
         return {
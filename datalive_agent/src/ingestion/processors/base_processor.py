@@ -3,8 +3,11 @@ Base processor class for document processing
 """
 
 import logging
+import os
+import stat as stat_module
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Tuple, Union
+from concurrent.futures import Executor
+from typing import Dict, Any, Tuple, Union, List, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -13,6 +16,11 @@ logger = logging.getLogger(__name__)
 class BaseProcessor(ABC):
     """Base class for document processors"""
     
+    # Process pool shared by a pipeline's processors and its size; the pipeline
+    # owns and shuts it down. Without one, CPU-bound work runs in this process.
+    executor: Optional[Executor] = None
+    executor_workers: int = 1
+    
     def __init__(self):
         self.name = self.__class__.__name__
         self.supported_extensions = []
@@ -42,10 +50,22 @@ class BaseProcessor(ABC):
     async def validate_source(self, source: Union[str, Path]) -> bool:
         """Validate that source exists and is accessible"""
         if isinstance(source, (str, Path)):
-            path = Path(source)
-            return path.exists() and path.is_file()
+            return self.stat_source(Path(source)) is not None
         return True  # For URLs or other sources
     
+    def stat_source(self, file_path: Path) -> Optional[os.stat_result]:
+        """
+        Stat a source file with a single syscall
+        
+        Returns None when the path is missing or not a regular file, so the
+        result doubles as the validate_source check.
+        """
+        try:
+            stat = file_path.stat()
+        except (OSError, ValueError):
+            return None
+        return stat if stat_module.S_ISREG(stat.st_mode) else None
+    
     def clean_text(self, text: str) -> str:
         """Clean and normalize extracted text"""
         if not text:
@@ -60,12 +80,26 @@ class BaseProcessor(ABC):
         
         return text.strip()
     
-    def extract_basic_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """Extract basic file metadata"""
-        if not file_path.exists():
-            return {}
+    def join_cleaned(self, parts: List[str]) -> str:
+        """
+        Join parts already passed through clean_text
         
-        stat = file_path.stat()
+        Equivalent to cleaning the newline-joined parts in one go, but lets
+        extractors clean each page or paragraph while it is still small.
+        """
+        return ' '.join(part for part in parts if part)
+    
+    def extract_basic_metadata(
+        self,
+        file_path: Path,
+        stat: Optional[os.stat_result] = None
+    ) -> Dict[str, Any]:
+        """Extract basic file metadata, reusing stat when the caller has one"""
+        if stat is None:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                return {}
         
         return {
             'title': file_path.stem,
@@ -2,8 +2,12 @@
 Confluence document processor using Atlassian Python API
 """
 
+import asyncio
+import hashlib
+import html
 import logging
-from typing import Dict, Any, Tuple, Union, List
+import threading
+from typing import Dict, Any, Tuple, Union, List, Optional
 from datetime import datetime
 import re
 
@@ -14,10 +18,39 @@ except ImportError:
     Confluence = None
     requests = None
 
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = None
+    lxml_html = None
+
 from .base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+# Storage bodies above this size are converted in slices of _HTML_CHUNK_SIZE
+_MAX_HTML_SIZE = 2_000_000
+_HTML_CHUNK_SIZE = 256 * 1024
+
+# Storage-format macro children that carry configuration rather than page text
+_DROPPED_MACRO_TAGS = frozenset({'ac:parameter', 'ac:placeholder'})
+
+# Text markers emitted before and after an element, matching the regex conversion
+_TAG_MARKERS = {
+    **{f'h{level}': ('\n## ', '\n') for level in range(1, 7)},
+    'p': ('\n', '\n'),
+    'br': ('\n', ''),
+    'li': ('\n- ', ''),
+    'strong': ('**', '**'),
+    'em': ('_', '_'),
+}
+
+_CDATA_PATTERN = re.compile(r'<!\[CDATA\[(.*?)\]\]>', re.DOTALL)
+
+# lxml parsers are not safe to share between threads
+_parser_local = threading.local()
+
 
 class ConfluenceProcessor(BaseProcessor):
     """Confluence document processor"""
@@ -25,6 +58,7 @@ class ConfluenceProcessor(BaseProcessor):
     def __init__(self):
         super().__init__()
         self.supported_extensions = []  # URL-based, no file extensions
+        self._client_cache: Dict[str, Confluence] = {}
         
         if not Confluence or not requests:
             logger.warning("atlassian-python-api or requests not installed. Confluence processing disabled.")
@@ -79,23 +113,23 @@ class ConfluenceProcessor(BaseProcessor):
             # Extract metadata
             metadata = self._extract_page_metadata(page_data, space_key)
             
+            # Fetch requested attachments and comments concurrently
+            attachments_content, comments_content = await asyncio.gather(
+                self._get_page_attachments(confluence, page_data['id'])
+                if include_attachments else self._skip_fetch(),
+                self._get_page_comments(confluence, page_data['id'])
+                if include_comments else self._skip_fetch()
+            )
+            
             # Add attachments if requested
-            if include_attachments:
-                attachments_content = await self._get_page_attachments(
-                    confluence, page_data['id']
-                )
-                if attachments_content:
-                    content += f"\n\n[Attachments]\n{attachments_content}"
-                    metadata['has_attachments'] = True
+            if attachments_content:
+                content += f"\n\n[Attachments]\n{attachments_content}"
+                metadata['has_attachments'] = True
             
             # Add comments if requested
-            if include_comments:
-                comments_content = await self._get_page_comments(
-                    confluence, page_data['id']
-                )
-                if comments_content:
-                    content += f"\n\n[Comments]\n{comments_content}"
-                    metadata['has_comments'] = True
+            if comments_content:
+                content += f"\n\n[Comments]\n{comments_content}"
+                metadata['has_comments'] = True
             
             return self.clean_text(content), metadata
             
@@ -103,8 +137,12 @@ class ConfluenceProcessor(BaseProcessor):
             logger.error(f"Error processing Confluence page {source}: {e}")
             raise
     
+    async def _skip_fetch(self) -> str:
+        """Placeholder for an optional fetch that was not requested"""
+        return ""
+    
     def _create_confluence_client(self, credentials: Dict[str, str]) -> Confluence:
-        """Create Confluence client with credentials"""
+        """Create Confluence client with credentials, reusing one per base_url and credentials"""
         base_url = credentials.get('base_url')
         if not base_url:
             raise ValueError("base_url required in credentials")
@@ -112,24 +150,42 @@ class ConfluenceProcessor(BaseProcessor):
         # Support different authentication methods
         if 'token' in credentials:
             # API token authentication
-            return Confluence(
-                url=base_url,
-                token=credentials['token']
-            )
+            secret = f"token:{credentials['token']}"
+            client_kwargs = {'token': credentials['token']}
         elif 'username' in credentials and 'password' in credentials:
             # Username/password authentication
-            return Confluence(
-                url=base_url,
-                username=credentials['username'],
-                password=credentials['password']
-            )
+            secret = f"basic:{credentials['username']}:{credentials['password']}"
+            client_kwargs = {
+                'username': credentials['username'],
+                'password': credentials['password']
+            }
         else:
             raise ValueError("Either 'token' or 'username'+'password' required in credentials")
+        
+        # Key on a digest so raw secrets are not kept as dict keys
+        cache_key = f"{base_url}|{hashlib.blake2b(secret.encode(), digest_size=8).hexdigest()}"
+        client = self._client_cache.get(cache_key)
+        if client is None:
+            client = Confluence(url=base_url, **client_kwargs)
+            self._client_cache[cache_key] = client
+        
+        return client
+    
+    def close(self) -> None:
+        """Close cached Confluence clients and their HTTP sessions"""
+        for client in self._client_cache.values():
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"Error closing Confluence client: {e}")
+        self._client_cache.clear()
     
     async def _get_page_by_id(self, confluence: Confluence, page_id: str) -> Dict[str, Any]:
         """Get page data by ID"""
         try:
-            page = confluence.get_page_by_id(
+            # The Atlassian client is blocking; keep it off the event loop
+            page = await asyncio.to_thread(
+                confluence.get_page_by_id,
                 page_id,
                 expand='body.storage,metadata,version,space,ancestors'
             )
@@ -155,7 +211,9 @@ class ConfluenceProcessor(BaseProcessor):
                     space_key = url_parts[idx + 1]
                     page_title = url_parts[idx + 2].replace('+', ' ')
                     
-                    page = confluence.get_page_by_title(space_key, page_title)
+                    page = await asyncio.to_thread(
+                        confluence.get_page_by_title, space_key, page_title
+                    )
                     if page:
                         return await self._get_page_by_id(confluence, page['id'])
             
@@ -173,6 +231,12 @@ class ConfluenceProcessor(BaseProcessor):
         title = page_data.get('title', 'Untitled')
         content_parts.append(f"# {title}\n")
         
+        # Add ancestors (breadcrumb) directly below the title
+        ancestors = page_data.get('ancestors', [])
+        if ancestors:
+            breadcrumb = ' > '.join(ancestor.get('title', '') for ancestor in ancestors)
+            content_parts.append(f"Location: {breadcrumb} > {title}\n")
+        
         # Extract body content
         body = page_data.get('body', {})
         storage_body = body.get('storage', {})
@@ -183,12 +247,6 @@ class ConfluenceProcessor(BaseProcessor):
             text_content = self._html_to_text(html_content)
             content_parts.append(text_content)
         
-        # Add ancestors (breadcrumb)
-        ancestors = page_data.get('ancestors', [])
-        if ancestors:
-            breadcrumb = ' > '.join([ancestor.get('title', '') for ancestor in ancestors])
-            content_parts.insert(1, f"Location: {breadcrumb} > {title}\n")
-        
         return '\n'.join(content_parts)
     
     def _extract_page_metadata(
@@ -244,9 +302,80 @@ class ConfluenceProcessor(BaseProcessor):
         if not html_content:
             return ""
         
+        # Bound memory and latency on pathological pages
+        if len(html_content) > _MAX_HTML_SIZE:
+            return self._html_to_text_streaming(html_content)
+        
+        if lxml_html:
+            text = self._html_to_text_lxml(html_content)
+            if text is not None:
+                return self._collapse_whitespace(text)
+        
+        return self._collapse_whitespace(self._convert_html_tags(html_content))
+    
+    def _html_to_text_lxml(self, html_content: str) -> Optional[str]:
+        """Convert HTML with a single lxml tree walk, dropping macro configuration"""
+        parser = getattr(_parser_local, 'parser', None)
+        if parser is None:
+            parser = _parser_local.parser = lxml_html.HTMLParser()
+        
+        # libxml2's HTML parser does not understand CDATA; keep code macro bodies as text
+        html_content = _CDATA_PATTERN.sub(lambda m: html.escape(m.group(1)), html_content)
+        
+        try:
+            root = lxml_html.fragment_fromstring(html_content, create_parent='div', parser=parser)
+        except (etree.ParserError, ValueError) as e:
+            logger.debug(f"lxml could not parse Confluence HTML, using regex conversion: {e}")
+            return None
+        
+        for element in list(root.iter()):
+            tag = element.tag
+            if not isinstance(tag, str):
+                continue
+            
+            if tag in _DROPPED_MACRO_TAGS:
+                element.drop_tree()
+                continue
+            
+            markers = _TAG_MARKERS.get(tag)
+            if markers:
+                prefix, suffix = markers
+                element.text = prefix + (element.text or '')
+                if suffix:
+                    element.tail = suffix + (element.tail or '')
+        
+        return root.text_content()
+    
+    def _html_to_text_streaming(self, html_content: str) -> str:
+        """Convert oversized HTML slice by slice instead of in whole-document passes"""
+        text_parts = []
+        pending = ''
+        
+        for start in range(0, len(html_content), _HTML_CHUNK_SIZE):
+            chunk = pending + html_content[start:start + _HTML_CHUNK_SIZE]
+            pending = ''
+            
+            # Hold back a tag cut off at the slice boundary for the next slice
+            tag_start = chunk.rfind('<')
+            if tag_start != -1 and chunk.find('>', tag_start) == -1 and len(chunk) - tag_start < _HTML_CHUNK_SIZE:
+                chunk, pending = chunk[:tag_start], chunk[tag_start:]
+            
+            # Plain text needs no tag conversion
+            if '<' not in chunk:
+                text_parts.append(chunk)
+            else:
+                text_parts.append(self._convert_html_tags(chunk))
+        
+        if pending:
+            text_parts.append(self._convert_html_tags(pending))
+        
+        return self._collapse_whitespace(''.join(text_parts))
+    
+    def _convert_html_tags(self, text: str) -> str:
+        """Replace common HTML tags with markdown-like markers and strip the rest"""
         # Simple HTML to text conversion
         # Remove XML namespace declarations
-        text = re.sub(r'<\?xml[^>]+\?>', '', html_content)
+        text = re.sub(r'<\?xml[^>]+\?>', '', text)
         
         # Convert common HTML tags
         text = re.sub(r'<h[1-6][^>]*>', '\n## ', text)
@@ -262,9 +391,10 @@ class ConfluenceProcessor(BaseProcessor):
         text = re.sub(r'</em>', '_', text)
         
         # Remove remaining HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
-        
-        # Clean up whitespace
+        return re.sub(r'<[^>]+>', '', text)
+    
+    def _collapse_whitespace(self, text: str) -> str:
+        """Clean up whitespace left behind by tag removal"""
         text = re.sub(r'\n\s*\n', '\n\n', text)
         text = re.sub(r'[ \t]+', ' ', text)
         
@@ -277,7 +407,9 @@ class ConfluenceProcessor(BaseProcessor):
     ) -> str:
         """Get attachments information for a page"""
         try:
-            attachments = confluence.get_attachments_from_content(page_id)
+            attachments = await asyncio.to_thread(
+                confluence.get_attachments_from_content, page_id
+            )
             if not attachments or not attachments.get('results'):
                 return ""
             
@@ -302,7 +434,7 @@ class ConfluenceProcessor(BaseProcessor):
     ) -> str:
         """Get comments for a page"""
         try:
-            comments = confluence.get_page_comments(page_id)
+            comments = await asyncio.to_thread(confluence.get_page_comments, page_id)
             if not comments or not comments.get('results'):
                 return ""
             
@@ -343,7 +475,8 @@ class ConfluenceProcessor(BaseProcessor):
             start = 0
             
             while True:
-                result = confluence.get_all_pages_from_space(
+                result = await asyncio.to_thread(
+                    confluence.get_all_pages_from_space,
                     space_key,
                     start=start,
                     limit=limit,
@@ -3,18 +3,72 @@ CSV processor for DataLive ingestion pipeline
 Handles .csv files with intelligent structure detection and content extraction
 """
 
+import asyncio
 import logging
 import csv
 import io
-from typing import Dict, Any, Tuple, List, Optional, Union
+import itertools
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Any, Tuple, List, Optional, Set, BinaryIO, TextIO, Type, Union
 from pathlib import Path
 from datetime import datetime
 import chardet
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+    pa_csv = None
+
 from .base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+# Bytes read for encoding detection and characters read for dialect sniffing
+_ENCODING_SAMPLE_SIZE = 64 * 1024
+_SNIFF_SIZE = 8192
+
+# Delimiters considered when sniffing the CSV dialect
+_DELIMITERS = ',;\t|'
+
+# Block size for pyarrow's streaming CSV reader
+_ARROW_BLOCK_SIZE = 1 << 20
+
+# Files at least this large are parsed in the shared worker pool, when there is one
+_PARALLEL_MIN_FILE_SIZE = 1024 * 1024
+
+# Tokens recognized as booleans and separators that suggest a date
+_BOOL_TOKENS = frozenset({'true', 'false', 'yes', 'no', '1', '0', 'y', 'n'})
+_DATE_SEP = frozenset('/-')
+
+
+@dataclass
+class _ColumnStats:
+    """Running statistics for one CSV column, updated as sample rows are parsed"""
+    numeric_votes: int = 0
+    boolean_votes: int = 0
+    date_votes: int = 0
+    typed_count: int = 0
+    empty_count: int = 0
+    unique_values: Set[str] = field(default_factory=set)
+    sample_values: List[str] = field(default_factory=list)
+    
+    def column_type(self) -> str:
+        """Detect column data type from the majority of type votes"""
+        if not self.typed_count:
+            return 'empty'
+        
+        if self.numeric_votes / self.typed_count > 0.7:
+            return 'numeric'
+        elif self.date_votes / self.typed_count > 0.7:
+            return 'date'
+        elif self.boolean_votes / self.typed_count > 0.7:
+            return 'boolean'
+        else:
+            return 'text'
+
 
 class CSVProcessor(BaseProcessor):
     """
@@ -64,32 +118,71 @@ class CSVProcessor(BaseProcessor):
         file_path: str,
         **kwargs
     ) -> Tuple[str, Dict[str, Any]]:
-        """Process CSV file"""
+        """Process CSV file, streaming rows instead of loading the whole file"""
+        if self.executor is not None and os.path.getsize(file_path) >= _PARALLEL_MIN_FILE_SIZE:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, _process_file_worker, str(file_path), kwargs)
+        return self._process_file_sync(file_path, **kwargs)
+    
+    def _process_file_sync(
+        self,
+        file_path: str,
+        **kwargs
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Synchronous body of _process_file, also run inside worker processes"""
         
         file_path = Path(file_path)
+        max_rows = kwargs.get('max_rows', 10000)
         
-        # Detect encoding
+        # Detect encoding from a prefix only; the body is streamed below
         with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            encoding_result = chardet.detect(raw_data)
-            encoding = encoding_result.get('encoding', 'utf-8')
-        
-        # Read file
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            logger.warning(f"Failed to decode with {encoding}, falling back to utf-8")
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            encoding = 'utf-8 (fallback)'
-        
-        # Process CSV content
-        processed_content, csv_metadata = await self._process_csv_content(content, **kwargs)
+            raw_sample = f.read(_ENCODING_SAMPLE_SIZE)
+        encoding = chardet.detect(raw_sample).get('encoding') or 'utf-8'
+        if encoding.lower() == 'ascii':
+            # An ASCII prefix says nothing about the rest of the file
+            encoding = 'utf-8'
+        
+        # Sniff the dialect once; an explicit delimiter overrides detection
+        dialect = self._sniff_dialect(
+            raw_sample[:_SNIFF_SIZE].decode(encoding, errors='ignore'),
+            kwargs.get('delimiter')
+        )
         
         # Get file stats
         stat = file_path.stat()
         
+        # Files that fit in the sample were read completely; parse those bytes instead of reopening
+        data = raw_sample if len(raw_sample) == stat.st_size else None
+        
+        # Prefer Arrow's vectorized reader, fall back to the csv module
+        result = None
+        if pa_csv and not dialect.skipinitialspace:
+            table = self._read_arrow_table(
+                str(file_path) if data is None else io.BytesIO(data), dialect, max_rows,
+                self._read_header(raw_sample.decode(encoding, errors='ignore'), dialect), encoding
+            )
+            if table is not None:
+                result = self._build_arrow_output(table, dialect.delimiter, stat.st_size, **kwargs)
+        
+        if result is None:
+            sample_rows = kwargs.get('sample_rows', 100)
+            try:
+                headers, rows, analysis = self._read_csv_file(
+                    file_path, encoding, dialect, max_rows, sample_rows, data=data
+                )
+            except UnicodeDecodeError:
+                logger.warning(f"Failed to decode with {encoding}, falling back to utf-8")
+                headers, rows, analysis = self._read_csv_file(
+                    file_path, 'utf-8', dialect, max_rows, sample_rows, errors='replace', data=data
+                )
+                encoding = 'utf-8 (fallback)'
+            result = self._build_csv_output(
+                headers, rows, len(rows), analysis, dialect.delimiter, stat.st_size,
+                'csv_parse', **kwargs
+            )
+        
+        processed_content, csv_metadata = result
+        
         # Combine metadata
         metadata = {
             'source_type': 'csv',
@@ -110,6 +203,137 @@ class CSVProcessor(BaseProcessor):
         logger.info(f"Processed CSV file: {file_path.name} ({csv_metadata['row_count']} rows, {csv_metadata['column_count']} columns)")
         return processed_content, metadata
     
+    def _read_csv_file(
+        self,
+        file_path: Path,
+        encoding: str,
+        dialect: Type[csv.Dialect],
+        max_rows: int,
+        sample_rows: int,
+        errors: str = 'strict',
+        data: Optional[bytes] = None
+    ) -> Tuple[Optional[List[str]], List[List[str]], Dict[str, Any]]:
+        """
+        Stream rows from a CSV file, stopping after max_rows
+        
+        When data holds the complete file contents it is decoded in memory
+        instead of reading the file again.
+        """
+        if data is not None:
+            return self._read_rows(
+                io.StringIO(data.decode(encoding, errors), newline=''), dialect, max_rows, sample_rows
+            )
+        with open(file_path, 'r', encoding=encoding, errors=errors, newline='') as f:
+            return self._read_rows(f, dialect, max_rows, sample_rows)
+    
+    def _read_rows(
+        self,
+        source: TextIO,
+        dialect: Type[csv.Dialect],
+        max_rows: int,
+        sample_rows: int
+    ) -> Tuple[Optional[List[str]], List[List[str]], Dict[str, Any]]:
+        """
+        Parse headers and up to max_rows data rows from a seekable text stream
+        
+        Column statistics for the first sample_rows rows are gathered while
+        the rows are parsed, so the data is only traversed once.
+        """
+        reader = csv.reader(source, dialect)
+        rows = []
+        headers = None
+        column_stats = []
+        
+        try:
+            # Assume first row is headers
+            first_row = next(reader, None)
+            if first_row is not None:
+                headers = list(map(str.strip, first_row))
+                column_stats = [_ColumnStats() for _ in headers]
+                for i, row in enumerate(itertools.islice(reader, max_rows)):
+                    row = list(map(str.strip, row))
+                    if i < sample_rows:
+                        self._observe_row(column_stats, row)
+                    rows.append(row)
+        except csv.Error as e:
+            logger.warning(f"CSV parsing error: {e}")
+            # Fallback to simple line processing
+            delimiter = dialect.delimiter
+            source.seek(0)
+            rows = []
+            header_line = source.readline()
+            headers = list(map(str.strip, header_line.split(delimiter))) if header_line else None
+            column_stats = [_ColumnStats() for _ in headers or []]
+            for line in itertools.islice(source, max_rows):
+                if line.strip():
+                    row = list(map(str.strip, line.split(delimiter)))
+                    if len(rows) < sample_rows:
+                        self._observe_row(column_stats, row)
+                    rows.append(row)
+        
+        analysis = self._analyze_csv_structure(headers, column_stats, min(len(rows), sample_rows))
+        return headers, rows, analysis
+    
+    def _read_header(self, sample: str, dialect: Type[csv.Dialect]) -> List[str]:
+        """Parse the raw header names from the start of the data"""
+        try:
+            return next(csv.reader(io.StringIO(sample, newline=''), dialect), [])
+        except csv.Error:
+            return []
+    
+    def _read_arrow_table(
+        self,
+        source: Union[str, BinaryIO],
+        dialect: Type[csv.Dialect],
+        max_rows: int,
+        header: List[str],
+        encoding: str = 'utf-8'
+    ) -> Optional['pa.Table']:
+        """
+        Read up to max_rows data rows with pyarrow's streaming CSV reader
+        
+        Every column is read as text, exactly as the csv module would return
+        it, so values and column type detection do not depend on whether
+        pyarrow is installed. Empty lines are kept so they surface as ragged
+        rows, as the csv module counts them as records.
+        
+        Returns None when Arrow cannot handle the input (ragged rows,
+        undecodable bytes, a header that did not fit in the sample), so
+        callers can fall back to the csv module.
+        """
+        try:
+            with pa_csv.open_csv(
+                source,
+                read_options=pa_csv.ReadOptions(encoding=encoding, block_size=_ARROW_BLOCK_SIZE),
+                parse_options=pa_csv.ParseOptions(
+                    delimiter=dialect.delimiter,
+                    quote_char=dialect.quotechar or False,
+                    double_quote=dialect.doublequote,
+                    newlines_in_values=True,
+                    ignore_empty_lines=False
+                ),
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header}
+                )
+            ) as reader:
+                batches = []
+                row_total = 0
+                for batch in reader:
+                    batches.append(batch)
+                    row_total += batch.num_rows
+                    if row_total >= max_rows:
+                        break
+                table = pa.Table.from_batches(batches, schema=reader.schema).slice(0, max_rows)
+        except (pa.ArrowInvalid, UnicodeDecodeError) as e:
+            logger.warning(f"Arrow CSV parsing failed, falling back to csv module: {e}")
+            return None
+        
+        # Columns missing from the parsed header were type-inferred
+        if not all(pa.types.is_string(column_type) for column_type in table.schema.types):
+            return None
+        
+        return table
+    
     async def _process_csv_content(
         self,
         content: str,
@@ -118,53 +342,95 @@ class CSVProcessor(BaseProcessor):
         """Process CSV content and extract structured data"""
         
         max_rows = kwargs.get('max_rows', 10000)
-        sample_rows = kwargs.get('sample_rows', 100)
-        delimiter = kwargs.get('delimiter')
         
-        # Detect delimiter if not provided
-        if not delimiter:
-            delimiter = self._detect_delimiter(content)
+        # Sniff the dialect once; an explicit delimiter overrides detection
+        dialect = self._sniff_dialect(content[:_SNIFF_SIZE], kwargs.get('delimiter'))
+        
+        # Prefer Arrow's vectorized reader, fall back to the csv module
+        if pa_csv and not dialect.skipinitialspace:
+            table = self._read_arrow_table(
+                io.BytesIO(content.encode('utf-8')), dialect, max_rows,
+                self._read_header(content[:_ENCODING_SAMPLE_SIZE], dialect)
+            )
+            result = None
+            if table is not None:
+                result = self._build_arrow_output(table, dialect.delimiter, len(content), **kwargs)
+            if result is not None:
+                return result
         
         # Parse CSV
-        reader = csv.reader(io.StringIO(content), delimiter=delimiter)
-        rows = []
-        headers = None
+        headers, rows, analysis = self._read_rows(
+            io.StringIO(content, newline=''), dialect, max_rows, kwargs.get('sample_rows', 100)
+        )
+        
+        return self._build_csv_output(
+            headers, rows, len(rows), analysis, dialect.delimiter, len(content),
+            'csv_parse', **kwargs
+        )
+    
+    def _build_arrow_output(
+        self,
+        table: 'pa.Table',
+        delimiter: str,
+        character_count: int,
+        **kwargs
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Analyze an Arrow table and build text plus metadata
         
-        try:
-            # Read and analyze data
-            for i, row in enumerate(reader):
-                if i == 0:
-                    # Assume first row is headers
-                    headers = [col.strip() for col in row]
-                elif i <= max_rows:
-                    rows.append([cell.strip() for cell in row])
-                else:
-                    break
-        except csv.Error as e:
-            logger.warning(f"CSV parsing error: {e}")
-            # Fallback to simple line processing
-            lines = content.split('\n')
-            if lines:
-                headers = [col.strip() for col in lines[0].split(delimiter)]
-                for line in lines[1:max_rows+1]:
-                    if line.strip():
-                        rows.append([cell.strip() for cell in line.split(delimiter)])
+        Only the sample and preview rows are converted to Python strings; they
+        go through the same column statistics as the csv-module path.
+        Returns None when a preview row is entirely empty: Arrow reads a blank
+        line and a row of empty cells alike, but the csv module renders them
+        differently, so those files are left to the csv module.
+        """
+        sample_rows = kwargs.get('sample_rows', 100)
+        headers = [name.strip() for name in table.column_names]
         
-        # Analyze structure
-        analysis = self._analyze_csv_structure(headers, rows[:sample_rows])
+        head = table.slice(0, max(sample_rows, 10))
+        columns = [
+            ['' if value is None else value.strip() for value in column.to_pylist()]
+            for column in head.columns
+        ]
+        rows = [list(row) for row in zip(*columns)]
+        if not all(map(any, rows[:10])):
+            return None
+        
+        column_stats = [_ColumnStats() for _ in headers]
+        for row in rows[:sample_rows]:
+            self._observe_row(column_stats, row)
+        analysis = self._analyze_csv_structure(headers, column_stats, min(len(rows), sample_rows))
+        
+        return self._build_csv_output(
+            headers, rows[:10], table.num_rows, analysis, delimiter, character_count,
+            'arrow_csv', **kwargs
+        )
+    
+    def _build_csv_output(
+        self,
+        headers: Optional[List[str]],
+        rows: List[List[str]],
+        row_count: int,
+        analysis: Dict[str, Any],
+        delimiter: str,
+        character_count: int,
+        extraction_method: str,
+        **kwargs
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Build searchable text and metadata from parsed rows and their analysis"""
         
         # Convert to searchable text
-        searchable_text = self._csv_to_text(headers, rows, analysis)
+        searchable_text = self._csv_to_text(headers, rows, analysis, row_count)
         
         # Generate metadata
         metadata = {
             'content_type': 'text/csv',
-            'character_count': len(content),
-            'row_count': len(rows),
+            'character_count': character_count,
+            'row_count': row_count,
             'column_count': len(headers) if headers else 0,
             'delimiter': delimiter,
             'processor': 'CSVProcessor',
-            'extraction_method': 'csv_parse',
+            'extraction_method': extraction_method,
             'created_at': datetime.now(),
             
             # CSV-specific metadata
@@ -173,7 +439,7 @@ class CSVProcessor(BaseProcessor):
             'has_headers': headers is not None,
             'estimated_data_types': {col: analysis.get(col, {}).get('type', 'text') for col in headers} if headers else {},
             'sample_data': rows[:5] if rows else [],  # First 5 rows as sample
-            'total_cells': len(rows) * len(headers) if headers else 0,
+            'total_cells': row_count * len(headers) if headers else 0,
             'empty_cells': analysis.get('empty_cells', 0),
             'data_quality_score': analysis.get('quality_score', 0.0)
         }
@@ -181,134 +447,151 @@ class CSVProcessor(BaseProcessor):
         # Add title from kwargs or filename pattern
         metadata['title'] = kwargs.get('title', 'CSV Dataset')
         
-        logger.info(f"Processed CSV content ({len(rows)} rows, {len(headers) if headers else 0} columns)")
+        logger.info(f"Processed CSV content ({row_count} rows, {len(headers) if headers else 0} columns)")
         return searchable_text, metadata
     
-    def _detect_delimiter(self, content: str) -> str:
-        """Detect CSV delimiter"""
-        # Try common delimiters
-        delimiters = [',', ';', '\t', '|']
-        
-        # Get first few lines
-        lines = content.split('\n')[:5]
-        sample = '\n'.join(lines)
-        
-        # Count occurrences of each delimiter
-        delimiter_counts = {}
-        for delimiter in delimiters:
-            count = 0
-            for line in lines:
-                if line.strip():
-                    count += line.count(delimiter)
-            delimiter_counts[delimiter] = count
+    def _sniff_dialect(self, sample: str, delimiter: Optional[str] = None) -> Type[csv.Dialect]:
+        """
+        Detect the CSV dialect (delimiter, quote character) from a sample
         
-        # Return most common delimiter
-        if delimiter_counts:
-            return max(delimiter_counts, key=delimiter_counts.get)
-        else:
-            return ','  # Default fallback
+        Quoting rules beyond the quote character keep the excel defaults,
+        since a sample without doubled quotes says nothing about later rows.
+        """
+        if delimiter:
+            return type('CSVDialect', (csv.excel,), {'delimiter': delimiter})
+        
+        # Only sniff complete lines
+        last_newline = sample.rfind('\n')
+        if last_newline > 0:
+            sample = sample[:last_newline]
+        
+        try:
+            sniffed = csv.Sniffer().sniff(sample, delimiters=_DELIMITERS)
+        except csv.Error:
+            return csv.excel  # Default fallback
+        
+        return type('CSVDialect', (csv.excel,), {
+            'delimiter': sniffed.delimiter,
+            'quotechar': sniffed.quotechar,
+            'skipinitialspace': sniffed.skipinitialspace
+        })
     
-    def _analyze_csv_structure(self, headers: List[str], sample_rows: List[List[str]]) -> Dict[str, Any]:
-        """Analyze CSV structure and data types"""
+    def _observe_row(self, column_stats: List['_ColumnStats'], row: List[str]) -> None:
+        """Fold one stripped sample row into the running column statistics"""
+        row_length = len(row)
+        
+        for col_idx, stats in enumerate(column_stats):
+            cell = row[col_idx] if col_idx < row_length else ''
+            if not cell:
+                stats.empty_count += 1
+                continue
+            
+            stats.unique_values.add(cell)
+            if len(stats.sample_values) < 3:
+                stats.sample_values.append(cell)
+            
+            # Type votes come from the first 10 non-empty values
+            if stats.typed_count < 10:
+                stats.typed_count += 1
+                value_type = self._classify_value(cell)
+                if value_type == 'numeric':
+                    stats.numeric_votes += 1
+                elif value_type == 'boolean':
+                    stats.boolean_votes += 1
+                elif value_type == 'date':
+                    stats.date_votes += 1
+    
+    def _analyze_csv_structure(
+        self,
+        headers: Optional[List[str]],
+        column_stats: List['_ColumnStats'],
+        sample_size: int
+    ) -> Dict[str, Any]:
+        """Summarize column statistics gathered while parsing into the structure analysis"""
         
-        if not headers or not sample_rows:
+        if not headers or not sample_size:
             return {'quality_score': 0.0, 'empty_cells': 0}
         
         analysis = {}
-        total_cells = 0
         empty_cells = 0
         
-        for col_idx, header in enumerate(headers):
-            col_data = []
-            col_empty = 0
-            
-            # Extract column data
-            for row in sample_rows:
-                if col_idx < len(row):
-                    cell = row[col_idx]
-                    if cell.strip():
-                        col_data.append(cell)
-                    else:
-                        col_empty += 1
-                        empty_cells += 1
-                else:
-                    col_empty += 1
-                    empty_cells += 1
-                total_cells += 1
-            
-            # Analyze data type
-            data_type = self._detect_column_type(col_data)
-            
-            # Calculate column quality
-            quality = (len(col_data) / (len(col_data) + col_empty)) if (len(col_data) + col_empty) > 0 else 0
+        for header, stats in zip(headers, column_stats):
+            filled = sample_size - stats.empty_count
+            empty_cells += stats.empty_count
             
             analysis[header] = {
-                'type': data_type,
-                'sample_values': col_data[:3],
-                'unique_values': len(set(col_data)),
-                'empty_count': col_empty,
-                'quality': quality
+                'type': stats.column_type(),
+                'sample_values': stats.sample_values,
+                'unique_values': len(stats.unique_values),
+                'empty_count': stats.empty_count,
+                'quality': filled / sample_size
             }
         
         # Overall quality score
+        total_cells = sample_size * len(headers)
         analysis['quality_score'] = (total_cells - empty_cells) / total_cells if total_cells > 0 else 0
         analysis['empty_cells'] = empty_cells
         
         return analysis
     
-    def _detect_column_type(self, values: List[str]) -> str:
-        """Detect column data type"""
-        if not values:
-            return 'empty'
-        
-        # Count type patterns
-        numeric_count = 0
-        date_count = 0
-        boolean_count = 0
+    def _classify_value(self, value: str) -> Optional[str]:
+        """Classify a single non-empty cell as numeric, boolean or date"""
         
-        for value in values[:10]:  # Sample first 10 values
-            value = value.strip()
-            
-            # Check numeric
-            try:
-                float(value.replace(',', ''))
-                numeric_count += 1
-                continue
-            except ValueError:
-                pass
-            
-            # Check boolean
-            if value.lower() in ['true', 'false', 'yes', 'no', '1', '0', 'y', 'n']:
-                boolean_count += 1
-                continue
-            
-            # Check date patterns (simple)
-            if any(char in value for char in ['/', '-']) and any(char.isdigit() for char in value):
-                if len(value.split('/')) == 3 or len(value.split('-')) == 3:
-                    date_count += 1
-                    continue
-        
-        # Determine type based on majority
-        total = len(values[:10])
-        if numeric_count / total > 0.7:
+        # Check numeric
+        if self._is_numeric(value):
             return 'numeric'
-        elif date_count / total > 0.7:
-            return 'date'
-        elif boolean_count / total > 0.7:
+        
+        # Check boolean
+        if value.lower() in _BOOL_TOKENS:
             return 'boolean'
-        else:
-            return 'text'
+        
+        # Check date patterns (simple)
+        if not _DATE_SEP.isdisjoint(value) and any(char.isdigit() for char in value):
+            if len(value.split('/')) == 3 or len(value.split('-')) == 3:
+                return 'date'
+        
+        return None
+    
+    def _is_numeric(self, value: str) -> bool:
+        """
+        Check whether value is a decimal number (thousands separators allowed)
+        
+        Uses str methods instead of a float() attempt so that text cells do
+        not pay for raising and catching ValueError.
+        """
+        mantissa, has_exponent, exponent = value.replace(',', '').lower().partition('e')
+        if has_exponent:
+            if exponent[:1] in ('+', '-'):
+                exponent = exponent[1:]
+            if not exponent.isdecimal():
+                return False
+        
+        if mantissa[:1] in ('+', '-'):
+            mantissa = mantissa[1:]
+        integer, _, fraction = mantissa.partition('.')
+        if not integer and not fraction:
+            return False
+        return (not integer or integer.isdecimal()) and (not fraction or fraction.isdecimal())
     
-    def _csv_to_text(self, headers: List[str], rows: List[List[str]], analysis: Dict[str, Any]) -> str:
+    def _csv_to_text(
+        self,
+        headers: List[str],
+        rows: List[List[str]],
+        analysis: Dict[str, Any],
+        row_count: Optional[int] = None
+    ) -> str:
         """Convert CSV data to searchable text format"""
         
         if not headers or not rows:
             return ""
         
+        if row_count is None:
+            row_count = len(rows)
+        
         text_parts = []
         
         # Add headers as description
-        text_parts.append(f"Dataset with {len(rows)} records and {len(headers)} fields:")
+        text_parts.append(f"Dataset with {row_count} records and {len(headers)} fields:")
         text_parts.append("Fields: " + ", ".join(headers))
         text_parts.append("")
         
@@ -340,8 +623,8 @@ class CSVProcessor(BaseProcessor):
             
             text_parts.append(f"Record {i+1}: " + "; ".join(row_text))
         
-        if len(rows) > 10:
-            text_parts.append(f"... and {len(rows) - 10} more records")
+        if row_count > 10:
+            text_parts.append(f"... and {row_count - 10} more records")
         
         return "\n".join(text_parts)
     
@@ -406,4 +689,9 @@ class CSVProcessor(BaseProcessor):
                 'text_conversion',
                 'metadata_enrichment'
             ]
-        }
\ No newline at end of file
+        }
+
+
+def _process_file_worker(file_path: str, kwargs: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """Process one CSV file in a worker process of the shared pool"""
+    return CSVProcessor()._process_file_sync(file_path, **kwargs)
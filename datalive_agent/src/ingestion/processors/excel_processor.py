@@ -2,22 +2,48 @@
 Excel document processor using openpyxl and pandas
 """
 
+import asyncio
+import functools
+import hashlib
+import json
 import logging
-from typing import Dict, Any, Tuple, Union
+import os
+import tempfile
+import warnings
+from contextlib import ExitStack, closing, suppress
+from typing import Dict, Any, Tuple, Union, Optional, List
 from pathlib import Path
 from datetime import datetime
 
 try:
     import openpyxl
+    from openpyxl.utils import get_column_letter, range_boundaries
     import pandas as pd
+    import numpy as np
 except ImportError:
     openpyxl = None
     pd = None
+    np = None
+
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
 
 from .base_processor import BaseProcessor
+from ...config import settings
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the extracted text or metadata format changes
+_CACHE_VERSION = 3
+
+# pandas engine for sheet data; calamine's Rust parser is faster when installed
+_EXCEL_ENGINE = 'calamine' if python_calamine else None
+
+# Multi-sheet workbooks at least this large have their sheet data read in worker processes
+_PARALLEL_MIN_FILE_SIZE = 5 * 1024 * 1024
+
 
 class ExcelProcessor(BaseProcessor):
     """Excel document processor"""
@@ -25,6 +51,9 @@ class ExcelProcessor(BaseProcessor):
     def __init__(self):
         super().__init__()
         self.supported_extensions = ['.xlsx', '.xls']
+        # Extraction results are cached on disk only when a cache directory is configured
+        self.cache_dir = Path(settings.excel_cache_dir).expanduser() if settings.excel_cache_dir else None
+        self.cache_max_bytes = settings.excel_cache_max_mb * 1024 * 1024
         
         if not openpyxl or not pd:
             logger.warning("openpyxl or pandas not installed. Excel processing will use fallback method.")
@@ -44,31 +73,50 @@ class ExcelProcessor(BaseProcessor):
                 - include_formulas: bool = False - Include formula information
                 - max_rows: int = None - Limit rows processed per sheet
                 - include_charts: bool = False - Include chart descriptions
+                - fast_describe: bool = True - Summarize numeric columns with min/mean/max
+                  only; False gives the full describe() statistics
+                - no_cache: bool = False - Skip the extraction cache, if one is configured
         
         Returns:
             Tuple of (content, metadata)
         """
         file_path = Path(source)
         
-        if not await self.validate_source(file_path):
+        stat = self.stat_source(file_path)
+        if stat is None:
             raise FileNotFoundError(f"Excel file not found: {file_path}")
         
         sheets = kwargs.get('sheets')
         include_formulas = kwargs.get('include_formulas', False)
         max_rows = kwargs.get('max_rows')
         include_charts = kwargs.get('include_charts', False)
+        fast_describe = kwargs.get('fast_describe', True)
+        no_cache = kwargs.get('no_cache', False)
         
         try:
             if pd and openpyxl:
-                content, metadata = await self._extract_with_pandas_openpyxl(
-                    file_path, sheets, include_formulas, max_rows, include_charts
-                )
+                cache_path = None
+                cached = None
+                if self.cache_dir and not no_cache:
+                    cache_path = self._cache_path(
+                        file_path, stat, sheets, include_formulas, max_rows, include_charts, fast_describe
+                    )
+                    cached = await asyncio.to_thread(self._load_cached, cache_path)
+                
+                if cached:
+                    content, metadata = cached
+                else:
+                    content, metadata = await self._extract_with_pandas_openpyxl(
+                        file_path, stat, sheets, include_formulas, max_rows, include_charts, fast_describe
+                    )
+                    if cache_path:
+                        await asyncio.to_thread(self._store_cached, cache_path, content, metadata)
             else:
                 # Fallback method
-                content, metadata = await self._extract_fallback(file_path)
+                content, metadata = await self._extract_fallback(file_path, stat)
             
             # Add basic file metadata
-            basic_metadata = self.extract_basic_metadata(file_path)
+            basic_metadata = self.extract_basic_metadata(file_path, stat)
             metadata.update(basic_metadata)
             
             return self.clean_text(content), metadata
@@ -77,13 +125,89 @@ class ExcelProcessor(BaseProcessor):
             logger.error(f"Error processing Excel file {file_path}: {e}")
             raise
     
+    def _cache_path(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        sheets: list = None,
+        include_formulas: bool = False,
+        max_rows: int = None,
+        include_charts: bool = False,
+        fast_describe: bool = True
+    ) -> Path:
+        """Build the cache file path from the workbook revision and extraction options"""
+        key = json.dumps([
+            _CACHE_VERSION, str(file_path.resolve()), stat.st_mtime_ns, stat.st_size,
+            sheets, include_formulas, max_rows, include_charts, fast_describe
+        ])
+        digest = hashlib.blake2b(key.encode(), digest_size=16)
+        
+        return self.cache_dir / f"{digest.hexdigest()}.json"
+    
+    def _load_cached(self, cache_path: Path) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Load a cached extraction result, or None on a miss"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            # Mark the entry as recently used so pruning drops it last
+            os.utime(cache_path)
+            return cached['content'], cached['metadata']
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable Excel cache entry {cache_path}: {e}")
+            return None
+    
+    def _store_cached(self, cache_path: Path, content: str, metadata: Dict[str, Any]) -> None:
+        """Write an extraction result to the cache; failures only cost a re-parse later"""
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # A unique temp file in the same directory, so the rename is atomic
+            with tempfile.NamedTemporaryFile(
+                'w', encoding='utf-8', dir=cache_path.parent, suffix='.tmp', delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump({'content': content, 'metadata': metadata}, f)
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not write Excel cache entry {cache_path}: {e}")
+            if tmp_path:
+                with suppress(OSError):
+                    os.unlink(tmp_path)
+            return
+        
+        self._prune_cache()
+    
+    def _prune_cache(self) -> None:
+        """Delete the least recently used cache entries until the cache fits cache_max_bytes"""
+        entries = []
+        for entry in self.cache_dir.glob('*.json'):
+            try:
+                entry_stat = entry.stat()
+            except OSError:
+                continue
+            entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.cache_max_bytes:
+                break
+            try:
+                entry.unlink()
+            except OSError:
+                continue
+            total -= size
+    
     async def _extract_with_pandas_openpyxl(
         self,
         file_path: Path,
+        stat: os.stat_result,
         sheets: list = None,
         include_formulas: bool = False,
         max_rows: int = None,
-        include_charts: bool = False
+        include_charts: bool = False,
+        fast_describe: bool = True
     ) -> Tuple[str, Dict[str, Any]]:
         """Extract content using pandas and openpyxl"""
         content_parts = []
@@ -96,52 +220,74 @@ class ExcelProcessor(BaseProcessor):
         
         # Load workbook with openpyxl for metadata
         try:
-            workbook = openpyxl.load_workbook(file_path, data_only=False)
-            
-            # Extract workbook metadata
-            props = workbook.properties
-            if props:
-                metadata.update({
-                    'title': props.title or file_path.stem,
-                    'author': props.creator,
-                    'subject': props.subject,
-                    'description': props.description,
-                    'keywords': props.keywords,
-                    'created_at': props.created.isoformat() if props.created else None,
-                    'modified_at': props.modified.isoformat() if props.modified else None
-                })
-            
-            # Get sheet names
-            sheet_names = workbook.sheetnames
-            if sheets:
-                sheet_names = [name for name in sheet_names if name in sheets]
-            
-            metadata['total_sheets'] = len(workbook.sheetnames)
-            metadata['processed_sheets'] = len(sheet_names)
-            
-            # Process each sheet
-            for sheet_name in sheet_names:
-                try:
-                    sheet_content, sheet_meta = await self._process_sheet(
-                        file_path, sheet_name, workbook[sheet_name],
-                        include_formulas, max_rows, include_charts
-                    )
-                    
-                    content_parts.append(f"\n## Sheet: {sheet_name}\n")
-                    content_parts.append(sheet_content)
-                    
-                    metadata['sheets'].append(sheet_meta)
-                    
-                    if sheet_meta.get('has_formulas'):
-                        metadata['has_formulas'] = True
-                    if sheet_meta.get('has_charts'):
-                        metadata['has_charts'] = True
+            with ExitStack() as stack:
+                # Read-only mode streams sheets instead of building the full cell DOM
+                workbook = stack.enter_context(closing(openpyxl.load_workbook(
+                    file_path, read_only=True, data_only=True, keep_links=False
+                )))
+                
+                # Formulas need the cell text rather than cached values
+                formula_workbook = None
+                if include_formulas:
+                    formula_workbook = stack.enter_context(closing(openpyxl.load_workbook(
+                        file_path, read_only=True, data_only=False, keep_links=False
+                    )))
+                
+                # Read-only worksheets do not expose charts
+                chart_workbook = None
+                if include_charts:
+                    chart_workbook = stack.enter_context(closing(openpyxl.load_workbook(
+                        file_path, data_only=True, keep_links=False
+                    )))
+                
+                # Extract workbook metadata
+                props = workbook.properties
+                if props:
+                    metadata.update({
+                        'title': props.title or file_path.stem,
+                        'author': props.creator,
+                        'subject': props.subject,
+                        'description': props.description,
+                        'keywords': props.keywords,
+                        'created_at': props.created.isoformat() if props.created else None,
+                        'modified_at': props.modified.isoformat() if props.modified else None
+                    })
+                
+                # Get sheet names
+                sheet_names = workbook.sheetnames
+                if sheets:
+                    wanted = frozenset(sheets)
+                    sheet_names = [name for name in sheet_names if name in wanted]
+                
+                metadata['total_sheets'] = len(workbook.sheetnames)
+                metadata['processed_sheets'] = len(sheet_names)
+                
+                # Read sheet data up front, in parallel for large workbooks
+                sheet_data = await self._read_sheets(file_path, stat, sheet_names, max_rows, fast_describe)
+                
+                # Process each sheet
+                for sheet_name in sheet_names:
+                    try:
+                        sheet_content, sheet_meta = await self._process_sheet(
+                            sheet_name, sheet_data[sheet_name],
+                            formula_workbook[sheet_name] if formula_workbook else None,
+                            max_rows,
+                            chart_workbook[sheet_name] if chart_workbook else None
+                        )
                         
-                except Exception as e:
-                    logger.warning(f"Error processing sheet {sheet_name}: {e}")
-                    content_parts.append(f"\n## Sheet: {sheet_name}\n[Error processing sheet: {str(e)}]\n")
-            
-            workbook.close()
+                        content_parts.append(f"\n## Sheet: {sheet_name}\n")
+                        content_parts.append(sheet_content)
+                        
+                        metadata['sheets'].append(sheet_meta)
+                        
+                        if sheet_meta.get('has_formulas'):
+                            metadata['has_formulas'] = True
+                        if sheet_meta.get('has_charts'):
+                            metadata['has_charts'] = True
+                            
+                    except Exception as e:
+                        logger.warning(f"Error processing sheet {sheet_name}: {e}")
+                        content_parts.append(f"\n## Sheet: {sheet_name}\n[Error processing sheet: {str(e)}]\n")
             
         except Exception as e:
             logger.error(f"Error loading Excel workbook: {e}")
@@ -149,61 +295,72 @@ class ExcelProcessor(BaseProcessor):
         
         return '\n'.join(content_parts), metadata
     
-    async def _process_sheet(
+    async def _read_sheets(
         self,
         file_path: Path,
+        stat: os.stat_result,
+        sheet_names: List[str],
+        max_rows: int = None,
+        fast_describe: bool = True
+    ) -> Dict[str, Tuple[List[str], Dict[str, Any]]]:
+        """
+        Read and render the data of each sheet, keyed by sheet name
+        
+        Large multi-sheet workbooks are split across the shared worker pool,
+        each worker opening the file once for its share of the sheets. Smaller
+        workbooks, or any workbook without a pool, are read in this process
+        from a single open file.
+        """
+        workers = min(len(sheet_names), self.executor_workers)
+        if (self.executor is None or workers < 2
+                or stat.st_size < _PARALLEL_MIN_FILE_SIZE):
+            results = _read_sheets_worker(str(file_path), sheet_names, max_rows, fast_describe)
+            return dict(zip(sheet_names, results))
+        
+        loop = asyncio.get_running_loop()
+        groups = [sheet_names[i::workers] for i in range(workers)]
+        group_results = await asyncio.gather(*(
+            loop.run_in_executor(
+                self.executor, _read_sheets_worker, str(file_path), group, max_rows, fast_describe
+            )
+            for group in groups
+        ))
+        
+        sheet_data = {}
+        for group, results in zip(groups, group_results):
+            sheet_data.update(zip(group, results))
+        return sheet_data
+    
+    async def _process_sheet(
+        self,
         sheet_name: str,
-        worksheet,
-        include_formulas: bool = False,
+        sheet_data: Tuple[List[str], Dict[str, Any]],
+        formula_sheet=None,
         max_rows: int = None,
-        include_charts: bool = False
+        chart_sheet=None
     ) -> Tuple[str, Dict[str, Any]]:
-        """Process a single worksheet"""
-        content_parts = []
-        sheet_metadata = {
-            'name': sheet_name,
-            'rows': 0,
-            'columns': 0,
-            'has_data': False,
-            'has_formulas': False,
-            'has_charts': False
-        }
+        """
+        Process a single worksheet
+        
+        sheet_data is the rendered data from _read_sheets. formula_sheet and
+        chart_sheet are the worksheet opened for formula and chart
+        extraction; None skips that extraction.
+        """
+        content_parts, sheet_metadata = sheet_data
+        content_parts = list(content_parts)
         
         try:
-            # Read sheet data with pandas
-            df = pd.read_excel(
-                file_path,
-                sheet_name=sheet_name,
-                nrows=max_rows,
-                keep_default_na=False
-            )
-            
-            if not df.empty:
-                sheet_metadata['has_data'] = True
-                sheet_metadata['rows'] = len(df)
-                sheet_metadata['columns'] = len(df.columns)
-                
-                # Convert to text representation
-                content_parts.append("Data:")
-                content_parts.append(df.to_string(index=False, max_rows=max_rows or 1000))
-                
-                # Add summary statistics for numeric columns
-                numeric_cols = df.select_dtypes(include=['number']).columns
-                if len(numeric_cols) > 0:
-                    content_parts.append("\nNumeric Summary:")
-                    content_parts.append(df[numeric_cols].describe().to_string())
-            
             # Check for formulas if requested
-            if include_formulas:
-                formulas = self._extract_formulas(worksheet, max_rows)
+            if formula_sheet is not None:
+                formulas = self._extract_formulas(formula_sheet, max_rows)
                 if formulas:
                     sheet_metadata['has_formulas'] = True
                     content_parts.append("\nFormulas:")
                     content_parts.append('\n'.join(formulas))
             
             # Check for charts if requested
-            if include_charts:
-                charts = self._extract_chart_info(worksheet)
+            if chart_sheet is not None:
+                charts = self._extract_chart_info(chart_sheet)
                 if charts:
                     sheet_metadata['has_charts'] = True
                     content_parts.append("\nCharts:")
@@ -220,12 +377,23 @@ class ExcelProcessor(BaseProcessor):
         formulas = []
         
         try:
-            row_limit = min(worksheet.max_row, max_rows or 1000)
+            row_limit = max_rows or 1000
+            # max_row is unreliable in read-only mode; the stored dimension
+            # bounds the scan to the used range when the sheet records one
+            try:
+                min_col, min_row, max_col, max_row = range_boundaries(worksheet.calculate_dimension())
+            except (ValueError, TypeError):
+                min_col = min_row = 1
+                max_col = max_row = None
+            if max_row is not None:
+                row_limit = min(row_limit, max_row)
             
-            for row in worksheet.iter_rows(max_row=row_limit):
+            for row in worksheet.iter_rows(min_row=min_row, max_row=row_limit,
+                                           min_col=min_col, max_col=max_col):
                 for cell in row:
+                    # Padding cells of empty rows are EmptyCell with data_type 'n'
                     if cell.data_type == 'f' and cell.value:  # Formula cell
-                        formulas.append(f"{cell.coordinate}: {cell.value}")
+                        formulas.append(f"{get_column_letter(cell.column)}{cell.row}: {cell.value}")
                         
         except Exception as e:
             logger.warning(f"Error extracting formulas: {e}")
@@ -249,7 +417,11 @@ class ExcelProcessor(BaseProcessor):
         
         return charts
     
-    async def _extract_fallback(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+    async def _extract_fallback(
+        self,
+        file_path: Path,
+        stat: os.stat_result
+    ) -> Tuple[str, Dict[str, Any]]:
         """Fallback extraction method"""
         logger.warning("Using fallback Excel extraction method")
         
@@ -261,23 +433,14 @@ class ExcelProcessor(BaseProcessor):
         # Simple approach - just indicate Excel content
         content = f"Excel Document: {file_path.name}\n"
         content += "Content extraction requires openpyxl and pandas libraries.\n"
-        content += f"File size: {file_path.stat().st_size} bytes"
+        content += f"File size: {stat.st_size} bytes"
         
         return content, metadata
     
     def get_sheet_names(self, file_path: Path) -> list:
         """Get list of sheet names without full extraction"""
         try:
-            if pd:
-                excel_file = pd.ExcelFile(file_path)
-                return excel_file.sheet_names
-            elif openpyxl:
-                workbook = openpyxl.load_workbook(file_path, read_only=True)
-                sheet_names = workbook.sheetnames
-                workbook.close()
-                return sheet_names
-            else:
-                return []
+            return list(_cached_sheet_names(*_stat_key(file_path)))
                 
         except Exception as e:
             logger.error(f"Error getting sheet names from {file_path}: {e}")
@@ -286,29 +449,138 @@ class ExcelProcessor(BaseProcessor):
     def get_excel_info(self, file_path: Path) -> Dict[str, Any]:
         """Get basic Excel information without full extraction"""
         try:
-            info = {
-                'file_size': file_path.stat().st_size,
-                'sheet_names': self.get_sheet_names(file_path)
-            }
-            
-            if openpyxl:
-                workbook = openpyxl.load_workbook(file_path, read_only=True)
-                info['total_sheets'] = len(workbook.sheetnames)
-                
-                # Get metadata
-                props = workbook.properties
-                if props:
-                    info.update({
-                        'title': props.title,
-                        'author': props.creator,
-                        'created_at': props.created.isoformat() if props.created else None,
-                        'modified_at': props.modified.isoformat() if props.modified else None
-                    })
-                
-                workbook.close()
-            
+            info = dict(_cached_excel_info(*_stat_key(file_path)))
+            info['sheet_names'] = list(info['sheet_names'])
             return info
             
         except Exception as e:
             logger.error(f"Error getting Excel info for {file_path}: {e}")
-            return {'error': str(e)}
\ No newline at end of file
+            return {'error': str(e)}
+
+
+def _stat_key(file_path: Path) -> Tuple[str, int, int]:
+    """Cache key for workbook metadata; a rewritten file changes mtime or size"""
+    stat = os.stat(file_path)
+    return str(file_path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_sheet_names(path: str, mtime_ns: int, size: int) -> Tuple[str, ...]:
+    """Sheet names of a workbook, cached per (path, mtime_ns, size)"""
+    if pd:
+        with pd.ExcelFile(path) as excel_file:
+            return tuple(excel_file.sheet_names)
+    elif openpyxl:
+        workbook = openpyxl.load_workbook(path, read_only=True, keep_links=False)
+        try:
+            return tuple(workbook.sheetnames)
+        finally:
+            workbook.close()
+    else:
+        return ()
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_excel_info(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Workbook metadata, cached per (path, mtime_ns, size); callers must copy"""
+    info = {
+        'file_size': size,
+        'sheet_names': _cached_sheet_names(path, mtime_ns, size)
+    }
+    
+    if openpyxl:
+        workbook = openpyxl.load_workbook(path, read_only=True, keep_links=False)
+        try:
+            info['total_sheets'] = len(workbook.sheetnames)
+            
+            # Get metadata
+            props = workbook.properties
+            if props:
+                info.update({
+                    'title': props.title,
+                    'author': props.creator,
+                    'created_at': props.created.isoformat() if props.created else None,
+                    'modified_at': props.modified.isoformat() if props.modified else None
+                })
+        finally:
+            workbook.close()
+    
+    return info
+
+
+def _read_sheet_data(
+    excel_file,
+    sheet_name: str,
+    max_rows: int = None,
+    fast_describe: bool = True
+) -> Tuple[List[str], Dict[str, Any]]:
+    """Render one sheet's data as text parts plus its sheet metadata"""
+    content_parts = []
+    sheet_metadata = {
+        'name': sheet_name,
+        'rows': 0,
+        'columns': 0,
+        'has_data': False,
+        'has_formulas': False,
+        'has_charts': False
+    }
+    
+    try:
+        # Read sheet data with pandas from the already opened file
+        df = excel_file.parse(
+            sheet_name=sheet_name,
+            nrows=max_rows,
+            keep_default_na=False
+        )
+        
+        if not df.empty:
+            sheet_metadata['has_data'] = True
+            sheet_metadata['rows'] = len(df)
+            sheet_metadata['columns'] = len(df.columns)
+            
+            # Convert to text representation; pandas' C CSV writer avoids
+            # to_string's column-width padding
+            content_parts.append("Data:")
+            content_parts.append(
+                df.head(max_rows or 1000).to_csv(index=False, sep='\t', lineterminator='\n').rstrip('\n')
+            )
+            
+            # Add summary statistics for numeric columns
+            numeric_cols = df.select_dtypes(include=['number']).columns
+            if len(numeric_cols) > 0:
+                content_parts.append("\nNumeric Summary:")
+                if fast_describe:
+                    summary = _numeric_summary(df[numeric_cols])
+                else:
+                    summary = df[numeric_cols].describe()
+                content_parts.append(summary.to_csv(sep='\t', lineterminator='\n').rstrip('\n'))
+        
+    except Exception as e:
+        logger.warning(f"Error processing sheet data for {sheet_name}: {e}")
+        content_parts.append(f"[Error reading sheet data: {str(e)}]")
+    
+    return content_parts, sheet_metadata
+
+
+def _numeric_summary(df):
+    """min/mean/max per column in single NumPy passes, skipping describe()'s quantile sorts"""
+    values = df.to_numpy(dtype=float, na_value=np.nan)
+    with warnings.catch_warnings():
+        # All-empty columns summarize to NaN
+        warnings.simplefilter('ignore', RuntimeWarning)
+        stats = [np.nanmin(values, axis=0), np.nanmean(values, axis=0), np.nanmax(values, axis=0)]
+    return pd.DataFrame(stats, index=['min', 'mean', 'max'], columns=df.columns)
+
+
+def _read_sheets_worker(
+    file_path: str,
+    sheet_names: List[str],
+    max_rows: int = None,
+    fast_describe: bool = True
+) -> List[Tuple[List[str], Dict[str, Any]]]:
+    """Read several sheets from one open file; runs inline or in a worker process"""
+    with pd.ExcelFile(file_path, engine=_EXCEL_ENGINE) as excel_file:
+        return [
+            _read_sheet_data(excel_file, sheet_name, max_rows, fast_describe)
+            for sheet_name in sheet_names
+        ]
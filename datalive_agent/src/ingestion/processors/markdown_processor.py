@@ -4,16 +4,98 @@ Handles .md files with structure preservation and metadata extraction
 """
 
 import logging
+import mmap
+import os
 import re
-from typing import Dict, Any, Tuple, List, Optional
+from typing import Dict, Any, Iterator, Tuple, List, Optional, Union
 from pathlib import Path
 from datetime import datetime
 import chardet
 
+try:
+    from charset_normalizer import from_bytes
+except ImportError:
+    from_bytes = None
+
+try:
+    import yaml
+    try:
+        from yaml import CSafeLoader as _YamlLoader
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader
+    
+    class _StringYamlLoader(_YamlLoader):
+        """YAML loader that keeps every scalar as its source text"""
+        # No implicit resolvers: dates, numbers, booleans and nulls stay strings,
+        # as the key/value parser gives them, so frontmatter stays JSON-serializable
+        yaml_implicit_resolvers = {}
+except ImportError:
+    yaml = None
+
+try:
+    from markdown_it import MarkdownIt
+except ImportError:
+    MarkdownIt = None
+
 from .base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+# Files at least this large are decoded straight from a memory map
+_MMAP_THRESHOLD = 1024 * 1024
+
+# Sources longer than this, or spanning lines, are markdown text, never paths
+_MAX_PATH_LENGTH = 4096
+
+# Leading sigils that mark a source as markdown text without touching the filesystem
+_MARKDOWN_SIGILS = ('# ', '## ', '```')
+
+# CommonMark tokenizer with GFM tables, shared by all processor instances
+_MARKDOWN_PARSER = MarkdownIt('commonmark').enable('table') if MarkdownIt else None
+
+# URL prefixes of links that leave the document set
+_EXTERNAL_LINK_PREFIXES = ('http://', 'https://', 'ftp://', 'mailto:')
+
+# Common stopwords used by _detect_language
+_SPANISH_WORDS = frozenset(['el', 'la', 'de', 'que', 'y', 'en', 'un', 'es', 'se', 'no'])
+_ENGLISH_WORDS = frozenset(['the', 'and', 'of', 'to', 'a', 'in', 'is', 'it', 'you', 'that'])
+
+# Patterns compiled once at import instead of on every call
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Line-level patterns used by _scan_markdown
+_HEADING_RE = re.compile(r'(#{1,6})\s+(.+)$')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+_FENCE_LANGUAGE_RE = re.compile(r'```(\w+)?')
+_INLINE_CODE_RE = re.compile(r'`([^`]+)`')
+
+# Markdown syntax stripped by _markdown_to_text in a single scan. Line-level
+# markers come before inline formatting so "* item" is a list, not italics;
+# the *_text groups keep the visible text of formatted spans.
+_MARKDOWN_TOKEN_RE = re.compile(
+    r'(?P<fenced>```.*?```)'  # Code blocks
+    r'|(?P<inline>`[^`]+`)'  # Inline code
+    r'|(?P<table>^[ \t]*\|[ \t]*|[ \t]*\|[ \t]*$)'  # Table borders
+    r'|(?P<list>^(?:[-*+]|\d+\.)\s+)'  # Lists and numbered lists
+    r'|(?P<heading>#{1,6}\s+)'  # Headings
+    r'|(?P<image>!\[(?P<image_text>[^\]]*)\]\([^)]+\))'  # Images
+    r'|(?P<link>\[(?P<link_text>[^\]]+)\]\([^)]+\))'  # Links
+    r'|(?P<bold>\*\*(?P<bold_text>[^*]+)\*\*)'  # Bold
+    r'|(?P<italic>\*(?P<italic_text>[^*]+)\*)'  # Italic
+    r'|(?P<underscore>_(?P<underscore_text>[^_]+)_)',  # Italic
+    re.DOTALL | re.MULTILINE
+)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+_ANCHOR_STRIP_RE = re.compile(r'[^\w\s-]')
+_ANCHOR_SEPARATOR_RE = re.compile(r'[\s_]+')
+
+# ASCII anchor table: drop punctuation except '-', turn '_' into a separator
+_ANCHOR_TABLE = str.maketrans(
+    {c: None for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in '-_')}
+    | {'_': ' '}
+)
+
 
 class MarkdownProcessor(BaseProcessor):
     """
@@ -46,7 +128,7 @@ class MarkdownProcessor(BaseProcessor):
             Tuple of (content, metadata)
         """
         try:
-            if Path(source).exists():
+            if self._source_path(source):
                 return await self._process_file(source, **kwargs)
             else:
                 return await self._process_markdown_content(source, **kwargs)
@@ -55,6 +137,13 @@ class MarkdownProcessor(BaseProcessor):
             logger.error(f"Error processing markdown source: {e}")
             raise
     
+    def _source_path(self, source: str) -> Optional[Path]:
+        """Return source as an existing Path, or None when it is markdown text"""
+        if isinstance(source, str) and (len(source) >= _MAX_PATH_LENGTH or '\n' in source):
+            return None
+        path = Path(source)
+        return path if path.exists() else None
+    
     async def _process_file(
         self,
         file_path: str,
@@ -64,28 +153,20 @@ class MarkdownProcessor(BaseProcessor):
         
         file_path = Path(file_path)
         
-        # Detect encoding
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            encoding_result = chardet.detect(raw_data)
-            encoding = encoding_result.get('encoding', 'utf-8')
-        
-        # Read file
-        try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                content = f.read()
-        except UnicodeDecodeError:
-            logger.warning(f"Failed to decode with {encoding}, falling back to utf-8")
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-            encoding = 'utf-8 (fallback)'
+        # Read the file once and decode the bytes in memory; unbuffered so the
+        # sized read below is a single read() with no extra fstat/EOF probe
+        with open(file_path, 'rb', buffering=0) as f:
+            stat = os.fstat(f.fileno())
+            if stat.st_size >= _MMAP_THRESHOLD:
+                # Large files skip the intermediate bytes copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    content, encoding = self._decode_markdown(mapped)
+            else:
+                content, encoding = self._decode_markdown(f.read(stat.st_size))
         
         # Process content and extract metadata
         processed_content, md_metadata = await self._process_markdown_content(content)
         
-        # Get file stats
-        stat = file_path.stat()
-        
         # Combine metadata
         metadata = {
             'source_type': 'markdown',
@@ -106,6 +187,31 @@ class MarkdownProcessor(BaseProcessor):
         logger.info(f"Processed markdown file: {file_path.name} ({len(content)} chars)")
         return processed_content, metadata
     
+    def _decode_markdown(self, raw_data: Union[bytes, mmap.mmap]) -> Tuple[str, str]:
+        """Decode file contents, trying UTF-8 before encoding detection"""
+        # Most Markdown is UTF-8; only run detection when that fails
+        try:
+            return str(raw_data, 'utf-8-sig'), 'utf-8'
+        except UnicodeDecodeError:
+            return self._decode_with_detection(bytes(raw_data))
+    
+    def _decode_with_detection(self, raw_data: bytes) -> Tuple[str, str]:
+        """Decode non-UTF-8 bytes using charset-normalizer, or chardet when it is missing"""
+        if from_bytes:
+            best = from_bytes(raw_data).best()
+            if best is not None:
+                return str(best), best.encoding
+        else:
+            encoding = chardet.detect(raw_data).get('encoding')
+            if encoding:
+                try:
+                    return raw_data.decode(encoding), encoding
+                except (UnicodeDecodeError, LookupError):
+                    pass
+        
+        logger.warning("Failed to detect encoding, falling back to utf-8")
+        return raw_data.decode('utf-8', errors='replace'), 'utf-8 (fallback)'
+    
     async def _process_markdown_content(
         self,
         content: str,
@@ -118,14 +224,13 @@ class MarkdownProcessor(BaseProcessor):
         if frontmatter['has_frontmatter']:
             content = frontmatter['content']
         
-        # Extract document structure
-        structure = self._extract_structure(content)
-        
-        # Extract links and references
-        links = self._extract_links(content)
+        lines = content.splitlines()
         
-        # Extract code blocks
-        code_blocks = self._extract_code_blocks(content)
+        # Extract document structure, links and code blocks in one scan
+        if _MARKDOWN_PARSER:
+            structure, links, code_blocks = self._scan_markdown_tokens(content)
+        else:
+            structure, links, code_blocks = self._scan_markdown(lines)
         
         # Convert to plain text for processing while preserving structure
         plain_text = self._markdown_to_text(content)
@@ -135,7 +240,7 @@ class MarkdownProcessor(BaseProcessor):
             'content_type': 'text/markdown',
             'character_count': len(content),
             'word_count': len(plain_text.split()),
-            'line_count': len(content.splitlines()),
+            'line_count': len(lines),
             'language': self._detect_language(plain_text),
             'processor': 'MarkdownProcessor',
             'extraction_method': 'markdown_parse',
@@ -158,7 +263,7 @@ class MarkdownProcessor(BaseProcessor):
         
         # Use frontmatter title if available
         if frontmatter['data'].get('title'):
-            metadata['title'] = frontmatter['data']['title']
+            metadata['title'] = str(frontmatter['data']['title'])
         elif structure['headings']:
             metadata['title'] = structure['headings'][0]['text']
         else:
@@ -166,19 +271,19 @@ class MarkdownProcessor(BaseProcessor):
         
         # Add author from frontmatter
         if frontmatter['data'].get('author'):
-            metadata['author'] = frontmatter['data']['author']
+            metadata['author'] = str(frontmatter['data']['author'])
         
-        # Add tags from frontmatter
-        if frontmatter['data'].get('tags'):
-            metadata['tags'] = frontmatter['data']['tags']
+        # Add tags from frontmatter; YAML may give a scalar or non-string items
+        tags = frontmatter['data'].get('tags')
+        if tags:
+            metadata['tags'] = [str(tag) for tag in tags] if isinstance(tags, list) else tags
         
         logger.info(f"Processed markdown content ({len(content)} chars, {len(structure['headings'])} headings)")
         return plain_text, metadata
     
     def _extract_frontmatter(self, content: str) -> Dict[str, Any]:
         """Extract YAML frontmatter from markdown"""
-        frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n'
-        match = re.match(frontmatter_pattern, content, re.DOTALL)
+        match = _FRONTMATTER_RE.match(content)
         
         if not match:
             return {
@@ -190,7 +295,24 @@ class MarkdownProcessor(BaseProcessor):
         frontmatter_text = match.group(1)
         content_without_frontmatter = content[match.end():]
         
-        # Simple YAML parsing (basic key: value pairs)
+        data = None
+        if yaml:
+            try:
+                data = yaml.load(frontmatter_text, Loader=_StringYamlLoader)
+            except yaml.YAMLError as e:
+                logger.warning(f"Invalid YAML frontmatter, using simple key/value parsing: {e}")
+        
+        if not isinstance(data, dict):
+            data = self._parse_simple_frontmatter(frontmatter_text)
+        
+        return {
+            'has_frontmatter': True,
+            'data': data,
+            'content': content_without_frontmatter
+        }
+    
+    def _parse_simple_frontmatter(self, frontmatter_text: str) -> Dict[str, Any]:
+        """Parse basic key: value frontmatter when PyYAML is unavailable or fails"""
         data = {}
         for line in frontmatter_text.split('\n'):
             line = line.strip()
@@ -205,137 +327,248 @@ class MarkdownProcessor(BaseProcessor):
                 
                 data[key] = value
         
-        return {
-            'has_frontmatter': True,
-            'data': data,
-            'content': content_without_frontmatter
-        }
+        return data
     
-    def _extract_structure(self, content: str) -> Dict[str, Any]:
-        """Extract document structure (headings, lists, tables)"""
+    def _scan_markdown_tokens(
+        self,
+        content: str
+    ) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, str]]], List[Dict[str, str]]]:
+        """
+        Extract document structure, links and code blocks from markdown-it tokens
+        
+        Same results as _scan_markdown, but from a CommonMark parse, so setext
+        headings, reference links and indented code are recognized too.
         
-        # Extract headings
+        Returns:
+            Tuple of (structure, links, code_blocks)
+        """
         headings = []
-        heading_pattern = r'^(#{1,6})\s+(.+)$'
-        for match in re.finditer(heading_pattern, content, re.MULTILINE):
-            level = len(match.group(1))
-            text = match.group(2).strip()
-            headings.append({
-                'level': level,
-                'text': text,
-                'anchor': self._text_to_anchor(text)
-            })
-        
-        # Count tables
-        table_count = len(re.findall(r'\|.*\|', content))
-        
-        # Count lists
-        list_pattern = r'^[\s]*[-*+]\s+|^[\s]*\d+\.\s+'
-        list_count = len(re.findall(list_pattern, content, re.MULTILINE))
+        table_count = 0
+        list_count = 0
+        links = {'internal': [], 'external': []}
+        block_code = []
+        inline_code = []
         
-        return {
+        heading_level = None
+        
+        for token in _MARKDOWN_PARSER.parse(content):
+            token_type = token.type
+            
+            if token_type == 'heading_open':
+                heading_level = int(token.tag[1:])
+            elif token_type == 'inline':
+                if heading_level is not None:
+                    text = token.content.strip()
+                    headings.append({
+                        'level': heading_level,
+                        'text': text,
+                        'anchor': self._text_to_anchor(text)
+                    })
+                    heading_level = None
+                self._collect_inline_tokens(token.children or [], links, inline_code)
+            elif token_type == 'fence':
+                info = token.info.split()
+                block_code.append({
+                    'language': info[0] if info else '',
+                    'code': token.content.rstrip('\n'),
+                    'type': 'fenced'
+                })
+            elif token_type == 'code_block':
+                block_code.append({
+                    'language': '',
+                    'code': token.content.rstrip('\n'),
+                    'type': 'indented'
+                })
+            elif token_type == 'table_open':
+                table_count += 1
+            elif token_type == 'list_item_open':
+                list_count += 1
+        
+        structure = {
             'headings': headings,
             'table_count': table_count,
             'list_count': list_count
         }
+        
+        return structure, links, block_code + inline_code
     
-    def _extract_links(self, content: str) -> Dict[str, List[Dict[str, str]]]:
-        """Extract internal and external links"""
+    def _collect_inline_tokens(
+        self,
+        children: list,
+        links: Dict[str, List[Dict[str, str]]],
+        inline_code: List[Dict[str, str]]
+    ) -> None:
+        """Gather links, images and inline code from an inline token's children"""
+        link_url = None
+        link_text = []
+        
+        for child in children:
+            child_type = child.type
+            
+            if child_type == 'link_open':
+                link_url = child.attrGet('href') or ''
+                link_text = []
+            elif child_type == 'link_close':
+                if link_url is not None:
+                    self._add_link(links, ''.join(link_text), link_url)
+                link_url = None
+            elif child_type == 'image':
+                self._add_link(links, child.content, child.attrGet('src') or '')
+            elif child_type == 'code_inline':
+                inline_code.append({
+                    'language': '',
+                    'code': child.content,
+                    'type': 'inline'
+                })
+                if link_url is not None:
+                    link_text.append(child.content)
+            elif child_type == 'text' and link_url is not None:
+                link_text.append(child.content)
+    
+    def _add_link(self, links: Dict[str, List[Dict[str, str]]], text: str, url: str) -> None:
+        """Record a link as internal or external"""
+        link_data = {'text': text, 'url': url}
         
-        # Pattern for markdown links [text](url)
-        link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
+        if url.startswith(_EXTERNAL_LINK_PREFIXES):
+            links['external'].append(link_data)
+        else:
+            links['internal'].append(link_data)
+    
+    def _scan_markdown(
+        self,
+        lines: List[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, List[Dict[str, str]]], List[Dict[str, str]]]:
+        """
+        Extract document structure, links and code blocks in a single pass
         
-        internal_links = []
-        external_links = []
+        Lines are walked once, tracking whether they sit inside a fenced code
+        block, so headings, tables, lists and links inside code are not counted.
+        Used when markdown-it-py is not installed.
         
-        for match in re.finditer(link_pattern, content):
-            text = match.group(1)
-            url = match.group(2)
+        Returns:
+            Tuple of (structure, links, code_blocks)
+        """
+        headings = []
+        table_count = 0
+        list_count = 0
+        links = {'internal': [], 'external': []}
+        fenced_blocks = []
+        inline_blocks = []
+        
+        fence_language = None
+        fence_lines = []
+        in_table = False
+        
+        for line in lines:
+            # Fenced code blocks
+            if fence_language is not None:
+                if line.startswith('```'):
+                    fenced_blocks.append({
+                        'language': fence_language,
+                        'code': '\n'.join(fence_lines),
+                        'type': 'fenced'
+                    })
+                    fence_language = None
+                    fence_lines = []
+                else:
+                    fence_lines.append(line)
+                continue
             
-            link_data = {'text': text, 'url': url}
+            if line.startswith('```'):
+                fence_language = _FENCE_LANGUAGE_RE.match(line).group(1) or ''
+                in_table = False
+                continue
             
-            if url.startswith(('http://', 'https://', 'ftp://', 'mailto:')):
-                external_links.append(link_data)
-            else:
-                internal_links.append(link_data)
-        
-        return {
-            'internal': internal_links,
-            'external': external_links
+            # Headings
+            match = _HEADING_RE.match(line)
+            if match:
+                text = match.group(2).strip()
+                headings.append({
+                    'level': len(match.group(1)),
+                    'text': text,
+                    'anchor': self._text_to_anchor(text)
+                })
+            
+            # Tables (a run of pipe rows counts once) and list items
+            is_table_row = line.count('|') >= 2
+            if is_table_row and not in_table:
+                table_count += 1
+            in_table = is_table_row
+            if self._is_list_item(line):
+                list_count += 1
+            
+            # Markdown links [text](url)
+            for match in _LINK_RE.finditer(line):
+                self._add_link(links, match.group(1), match.group(2))
+            
+            # Inline code
+            for match in _INLINE_CODE_RE.finditer(line):
+                inline_blocks.append({
+                    'language': '',
+                    'code': match.group(1),
+                    'type': 'inline'
+                })
+        
+        structure = {
+            'headings': headings,
+            'table_count': table_count,
+            'list_count': list_count
         }
+        
+        return structure, links, fenced_blocks + inline_blocks
     
-    def _extract_code_blocks(self, content: str) -> List[Dict[str, str]]:
-        """Extract code blocks with language information"""
-        
-        code_blocks = []
-        
-        # Fenced code blocks
-        fenced_pattern = r'```(\w+)?\n(.*?)\n```'
-        for match in re.finditer(fenced_pattern, content, re.DOTALL):
-            language = match.group(1) or ''
-            code = match.group(2)
-            code_blocks.append({
-                'language': language,
-                'code': code,
-                'type': 'fenced'
-            })
-        
-        # Inline code
-        inline_pattern = r'`([^`]+)`'
-        for match in re.finditer(inline_pattern, content):
-            code_blocks.append({
-                'language': '',
-                'code': match.group(1),
-                'type': 'inline'
-            })
-        
-        return code_blocks
+    @staticmethod
+    def _is_list_item(line: str) -> bool:
+        """Whether a line starts a bullet (-, *, +) or numbered (1.) list item"""
+        stripped = line.lstrip()
+        if len(stripped) < 2:
+            return False
+        if stripped[0] in '-*+':
+            return stripped[1].isspace()
+        digits = len(stripped) - len(stripped.lstrip('0123456789'))
+        return digits > 0 and stripped[digits:digits + 1] == '.' and stripped[digits + 1:digits + 2].isspace()
     
     def _markdown_to_text(self, content: str) -> str:
         """Convert markdown to plain text"""
         
-        # Remove code blocks first
-        content = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-        
-        # Remove inline code
-        content = re.sub(r'`[^`]+`', '', content)
-        
-        # Remove markdown formatting
-        content = re.sub(r'#{1,6}\s+', '', content)  # Headings
-        content = re.sub(r'\*\*([^*]+)\*\*', r'\1', content)  # Bold
-        content = re.sub(r'\*([^*]+)\*', r'\1', content)  # Italic
-        content = re.sub(r'_([^_]+)_', r'\1', content)  # Italic
-        content = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', content)  # Links
-        content = re.sub(r'!\[([^\]]*)\]\([^)]+\)', r'\1', content)  # Images
-        content = re.sub(r'^[-*+]\s+', '', content, flags=re.MULTILINE)  # Lists
-        content = re.sub(r'^\d+\.\s+', '', content, flags=re.MULTILINE)  # Numbered lists
-        content = re.sub(r'^\s*\|\s*', '', content, flags=re.MULTILINE)  # Tables
-        content = re.sub(r'\s*\|\s*$', '', content, flags=re.MULTILINE)  # Tables
+        # Strip code and formatting in one pass, joining the kept text once
+        content = ''.join(self._plain_text_fragments(content))
         
         # Clean up extra whitespace
-        content = re.sub(r'\n\s*\n', '\n\n', content)
-        content = content.strip()
-        
-        return content
+        return _BLANK_LINES_RE.sub('\n\n', content).strip()
+    
+    def _plain_text_fragments(self, content: str) -> Iterator[str]:
+        """Yield the text around _MARKDOWN_TOKEN_RE matches and inside formatted spans"""
+        pos = 0
+        for match in _MARKDOWN_TOKEN_RE.finditer(content):
+            yield content[pos:match.start()]
+            kind = match.lastgroup
+            if kind in ('image', 'link', 'bold', 'italic', 'underscore'):
+                # Formatting may nest, e.g. bold text inside a link
+                yield from self._plain_text_fragments(match.group(f'{kind}_text'))
+            pos = match.end()
+        yield content[pos:]
     
     def _text_to_anchor(self, text: str) -> str:
         """Convert heading text to anchor"""
         # Simple anchor generation
         anchor = text.lower()
-        anchor = re.sub(r'[^\w\s-]', '', anchor)
-        anchor = re.sub(r'[\s_]+', '-', anchor)
+        if anchor.isascii():
+            return '-'.join(anchor.translate(_ANCHOR_TABLE).split()).strip('-')
+        
+        # Unicode punctuation needs the regex character classes
+        anchor = _ANCHOR_STRIP_RE.sub('', anchor)
+        anchor = _ANCHOR_SEPARATOR_RE.sub('-', anchor)
         return anchor.strip('-')
     
     def _detect_language(self, text: str) -> str:
         """Simple language detection"""
-        # Reuse logic from TXT processor
-        text_lower = text.lower()
-        
-        spanish_words = ['el', 'la', 'de', 'que', 'y', 'en', 'un', 'es', 'se', 'no']
-        spanish_count = sum(1 for word in spanish_words if f' {word} ' in text_lower)
+        # Reuse logic from TXT processor: count distinct stopwords present,
+        # tokenizing once instead of scanning the text per stopword
+        words = set(text.lower().split())
         
-        english_words = ['the', 'and', 'of', 'to', 'a', 'in', 'is', 'it', 'you', 'that']
-        english_count = sum(1 for word in english_words if f' {word} ' in text_lower)
+        spanish_count = len(_SPANISH_WORDS & words)
+        english_count = len(_ENGLISH_WORDS & words)
         
         if spanish_count > english_count:
             return 'es'
@@ -347,8 +580,10 @@ class MarkdownProcessor(BaseProcessor):
     async def validate_source(self, source: str) -> bool:
         """Validate if source can be processed"""
         try:
-            if Path(source).exists():
-                file_path = Path(source)
+            if isinstance(source, str) and source.startswith(_MARKDOWN_SIGILS):
+                return True
+            file_path = self._source_path(source)
+            if file_path:
                 return file_path.suffix.lower() in self.supported_extensions
             else:
                 # Check if it looks like markdown content
@@ -359,8 +594,8 @@ class MarkdownProcessor(BaseProcessor):
     async def get_metadata_preview(self, source: str) -> Dict[str, Any]:
         """Get metadata without full content extraction"""
         try:
-            if Path(source).exists():
-                file_path = Path(source)
+            file_path = self._source_path(source)
+            if file_path:
                 stat = file_path.stat()
                 
                 return {
@@ -1,9 +1,13 @@
 """
-PDF document processor using PyPDF2 and pdfplumber
+PDF document processor using PyMuPDF, pdfplumber and PyPDF2
 """
 
+import asyncio
+import functools
 import logging
-from typing import Dict, Any, Tuple, Union
+import os
+import re
+from typing import Dict, Any, Tuple, Union, List
 from pathlib import Path
 from datetime import datetime
 
@@ -14,10 +18,41 @@ except ImportError:
     PyPDF2 = None
     pdfplumber = None
 
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
 from .base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+# PDFs with at least this many pages have their pages extracted in the shared worker pool
+_PARALLEL_MIN_PAGES = 20
+
+# Pages handed to a worker per task; each task opens the document once
+_PAGE_CHUNK_SIZE = 10
+
+# Default cap on pool workers used at once by one document
+_MAX_PAGE_WORKERS = 4
+
+# Metadata fields filled from the PDF info dictionary, as field -> (info key, PyMuPDF key)
+_PDF_METADATA_FIELDS = {
+    'title': ('Title', 'title'),
+    'author': ('Author', 'author'),
+    'subject': ('Subject', 'subject'),
+    'creator': ('Creator', 'creator'),
+    'producer': ('Producer', 'producer'),
+    'creation_date': ('CreationDate', 'creationDate'),
+    'modification_date': ('ModDate', 'modDate')
+}
+
+# A BT (begin text object) operator; every text-showing operator sits inside one
+_BEGIN_TEXT = re.compile(rb'(?<![^\s\]>)])BT(?![^\s\[<(/])')
+
+# One extracted PyMuPDF page: content parts, image count, skipped flag, text blocks
+_PageResult = Tuple[List[str], int, bool, List[Dict[str, Any]]]
+
 
 class PDFProcessor(BaseProcessor):
     """PDF document processor"""
@@ -26,8 +61,8 @@ class PDFProcessor(BaseProcessor):
         super().__init__()
         self.supported_extensions = ['.pdf']
         
-        if not PyPDF2 or not pdfplumber:
-            logger.warning("PyPDF2 or pdfplumber not installed. PDF processing will use fallback method.")
+        if not pymupdf and (not PyPDF2 or not pdfplumber):
+            logger.warning("PyMuPDF, PyPDF2 or pdfplumber not installed. PDF processing will use fallback method.")
     
     async def extract_content(
         self,
@@ -42,20 +77,34 @@ class PDFProcessor(BaseProcessor):
             **kwargs: Additional processing parameters
                 - extract_tables: bool = False - Extract tables separately
                 - extract_images: bool = False - Extract image descriptions
+                - num_workers: int = 4 - Max pool workers used at once for large PDFs (PyMuPDF)
+                - skip_image_only_pages: bool = True - Skip text extraction on scanned
+                  pages without text operators (PyMuPDF)
+                - return_blocks: bool = False - Build page text from layout blocks and
+                  keep them in metadata['blocks_per_page'] (PyMuPDF)
         
         Returns:
             Tuple of (content, metadata)
         """
         file_path = Path(source)
         
-        if not await self.validate_source(file_path):
+        stat = self.stat_source(file_path)
+        if stat is None:
             raise FileNotFoundError(f"PDF file not found: {file_path}")
         
         extract_tables = kwargs.get('extract_tables', False)
         extract_images = kwargs.get('extract_images', False)
+        num_workers = kwargs.get('num_workers', _MAX_PAGE_WORKERS)
+        skip_image_only_pages = kwargs.get('skip_image_only_pages', True)
+        return_blocks = kwargs.get('return_blocks', False)
         
         try:
-            if pdfplumber:
+            # PyMuPDF is much faster for text; pdfplumber is kept for table extraction
+            if pymupdf and not (extract_tables and pdfplumber):
+                content, metadata = await self._extract_with_pymupdf(
+                    file_path, extract_images, num_workers, skip_image_only_pages, return_blocks
+                )
+            elif pdfplumber:
                 content, metadata = await self._extract_with_pdfplumber(
                     file_path, extract_tables, extract_images
                 )
@@ -63,18 +112,103 @@ class PDFProcessor(BaseProcessor):
                 content, metadata = await self._extract_with_pypdf2(file_path)
             else:
                 # Fallback to simple text extraction
-                content, metadata = await self._extract_fallback(file_path)
+                content, metadata = await self._extract_fallback(file_path, stat)
+                content = self.clean_text(content)
             
             # Add basic file metadata
-            basic_metadata = self.extract_basic_metadata(file_path)
+            basic_metadata = self.extract_basic_metadata(file_path, stat)
             metadata.update(basic_metadata)
             
-            return self.clean_text(content), metadata
+            # Extractors clean each page as they go
+            return content, metadata
             
         except Exception as e:
             logger.error(f"Error processing PDF {file_path}: {e}")
             raise
     
+    async def _extract_with_pymupdf(
+        self,
+        file_path: Path,
+        extract_images: bool = False,
+        num_workers: int = _MAX_PAGE_WORKERS,
+        skip_image_only_pages: bool = True,
+        return_blocks: bool = False
+    ) -> Tuple[str, Dict[str, Any]]:
+        """Extract content using PyMuPDF (fastest, text only)"""
+        content_parts = []
+        metadata = {
+            'page_count': 0,
+            'has_tables': False,
+            'has_images': False,
+            'skipped_pages': [],
+            'extraction_method': 'pymupdf'
+        }
+        
+        with pymupdf.open(file_path) as doc:
+            metadata['page_count'] = doc.page_count
+            
+            # Extract PDF metadata; PyMuPDF reports missing fields as empty strings
+            pdf_meta = doc.metadata
+            if pdf_meta:
+                for field, (_, pymupdf_key) in _PDF_METADATA_FIELDS.items():
+                    metadata[field] = pdf_meta.get(pymupdf_key) or None
+                metadata['title'] = metadata['title'] or file_path.stem
+            
+            workers = min(num_workers or 1, self.executor_workers)
+            if self.executor is None or workers < 2 or doc.page_count < _PARALLEL_MIN_PAGES:
+                page_results = [
+                    _extract_pymupdf_page(doc, i, extract_images, skip_image_only_pages, return_blocks)
+                    for i in range(doc.page_count)
+                ]
+            else:
+                page_results = await self._extract_pages_parallel(
+                    file_path, doc.page_count, extract_images, skip_image_only_pages,
+                    return_blocks, workers
+                )
+        
+        if return_blocks:
+            metadata['blocks_per_page'] = [blocks for *_, blocks in page_results]
+        
+        for page_number, (page_parts, image_count, skipped, _) in enumerate(page_results, 1):
+            content_parts.extend(self.clean_text(part) for part in page_parts)
+            if image_count:
+                metadata['has_images'] = True
+            if skipped:
+                metadata['skipped_pages'].append(page_number)
+        
+        return self.join_cleaned(content_parts), metadata
+    
+    async def _extract_pages_parallel(
+        self,
+        file_path: Path,
+        page_count: int,
+        extract_images: bool,
+        skip_image_only_pages: bool,
+        return_blocks: bool,
+        workers: int
+    ) -> List[_PageResult]:
+        """
+        Extract pages in the shared worker pool, in page order
+        
+        Pages are split into chunks of _PAGE_CHUNK_SIZE and at most `workers`
+        chunks run at once, so memory stays bounded on very long documents.
+        """
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(workers)
+        
+        async def run_chunk(page_numbers: range) -> List[_PageResult]:
+            async with limit:
+                return await loop.run_in_executor(
+                    self.executor, _extract_pymupdf_pages, str(file_path), page_numbers,
+                    extract_images, skip_image_only_pages, return_blocks
+                )
+        
+        chunks = await asyncio.gather(*(
+            run_chunk(range(start, min(start + _PAGE_CHUNK_SIZE, page_count)))
+            for start in range(0, page_count, _PAGE_CHUNK_SIZE)
+        ))
+        return [result for chunk in chunks for result in chunk]
+    
     async def _extract_with_pdfplumber(
         self,
         file_path: Path,
@@ -95,22 +229,13 @@ class PDFProcessor(BaseProcessor):
             
             # Extract PDF metadata
             if pdf.metadata:
-                pdf_meta = pdf.metadata
-                metadata.update({
-                    'title': pdf_meta.get('Title', file_path.stem),
-                    'author': pdf_meta.get('Author'),
-                    'subject': pdf_meta.get('Subject'),
-                    'creator': pdf_meta.get('Creator'),
-                    'producer': pdf_meta.get('Producer'),
-                    'creation_date': pdf_meta.get('CreationDate'),
-                    'modification_date': pdf_meta.get('ModDate')
-                })
+                self._add_pdf_metadata(metadata, pdf.metadata, file_path)
             
             for i, page in enumerate(pdf.pages):
                 # Extract text
                 page_text = page.extract_text()
                 if page_text:
-                    content_parts.append(f"[Page {i+1}]\n{page_text}\n")
+                    content_parts.append(self.clean_text(f"[Page {i+1}]\n{page_text}"))
                 
                 # Extract tables if requested
                 if extract_tables:
@@ -119,14 +244,14 @@ class PDFProcessor(BaseProcessor):
                         metadata['has_tables'] = True
                         for j, table in enumerate(tables):
                             table_text = self._format_table(table, i+1, j+1)
-                            content_parts.append(table_text)
+                            content_parts.append(self.clean_text(table_text))
                 
                 # Check for images
-                if extract_images and hasattr(page, 'images') and page.images:
+                if extract_images and page.images:
                     metadata['has_images'] = True
                     content_parts.append(f"[Page {i+1} contains {len(page.images)} images]")
         
-        return '\n'.join(content_parts), metadata
+        return self.join_cleaned(content_parts), metadata
     
     async def _extract_with_pypdf2(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
         """Extract content using PyPDF2 (fallback)"""
@@ -140,31 +265,27 @@ class PDFProcessor(BaseProcessor):
             metadata['page_count'] = len(pdf_reader.pages)
             
             # Extract PDF metadata
-            if pdf_reader.metadata:
-                pdf_meta = pdf_reader.metadata
-                metadata.update({
-                    'title': pdf_meta.get('/Title', file_path.stem),
-                    'author': pdf_meta.get('/Author'),
-                    'subject': pdf_meta.get('/Subject'),
-                    'creator': pdf_meta.get('/Creator'),
-                    'producer': pdf_meta.get('/Producer'),
-                    'creation_date': pdf_meta.get('/CreationDate'),
-                    'modification_date': pdf_meta.get('/ModDate')
-                })
+            pdf_meta = pdf_reader.metadata
+            if pdf_meta:
+                self._add_pdf_metadata(metadata, pdf_meta, file_path, key_prefix='/')
             
             # Extract text from each page
             for i, page in enumerate(pdf_reader.pages):
                 try:
                     page_text = page.extract_text()
                     if page_text:
-                        content_parts.append(f"[Page {i+1}]\n{page_text}\n")
+                        content_parts.append(self.clean_text(f"[Page {i+1}]\n{page_text}"))
                 except Exception as e:
                     logger.warning(f"Error extracting text from page {i+1}: {e}")
                     content_parts.append(f"[Page {i+1} - text extraction failed]")
         
-        return '\n'.join(content_parts), metadata
+        return self.join_cleaned(content_parts), metadata
     
-    async def _extract_fallback(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+    async def _extract_fallback(
+        self,
+        file_path: Path,
+        stat: os.stat_result
+    ) -> Tuple[str, Dict[str, Any]]:
         """Fallback extraction method"""
         logger.warning("Using fallback PDF extraction method")
         
@@ -175,47 +296,154 @@ class PDFProcessor(BaseProcessor):
         
         # Simple approach - just indicate PDF content
         content = f"PDF Document: {file_path.name}\n"
-        content += "Content extraction requires PyPDF2 or pdfplumber libraries.\n"
-        content += f"File size: {file_path.stat().st_size} bytes"
+        content += "Content extraction requires PyMuPDF, PyPDF2 or pdfplumber libraries.\n"
+        content += f"File size: {stat.st_size} bytes"
         
         return content, metadata
     
+    def _add_pdf_metadata(
+        self,
+        metadata: Dict[str, Any],
+        pdf_meta: Dict[str, Any],
+        file_path: Path,
+        key_prefix: str = ''
+    ) -> None:
+        """Copy PDF info dictionary fields into metadata as plain strings"""
+        for field, (info_key, _) in _PDF_METADATA_FIELDS.items():
+            value = pdf_meta.get(key_prefix + info_key)
+            metadata[field] = f"{value}" if value is not None else None
+        if metadata['title'] is None:
+            metadata['title'] = file_path.stem
+    
     def _format_table(self, table: list, page_num: int, table_num: int) -> str:
         """Format extracted table as text"""
         if not table:
             return ""
         
-        table_text = f"\n[Table {table_num} on Page {page_num}]\n"
-        
-        for row in table:
-            if row:
-                # Filter out None values and join with tabs
-                clean_row = [str(cell) if cell is not None else "" for cell in row]
-                table_text += "\t".join(clean_row) + "\n"
+        # Tab-separated rows with None cells blanked, built in a single join
+        rows = [
+            "\t".join("" if cell is None else f"{cell}" for cell in row)
+            for row in table if row
+        ]
+        rows += ["", ""]  # trailing newline after the last row, then a blank line
         
-        return table_text + "\n"
+        return f"\n[Table {table_num} on Page {page_num}]\n" + "\n".join(rows)
     
     def get_pdf_info(self, file_path: Path) -> Dict[str, Any]:
         """Get basic PDF information without full extraction"""
         try:
-            if pdfplumber:
-                with pdfplumber.open(file_path) as pdf:
-                    return {
-                        'page_count': len(pdf.pages),
-                        'metadata': pdf.metadata or {},
-                        'file_size': file_path.stat().st_size
-                    }
-            elif PyPDF2:
-                with open(file_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    return {
-                        'page_count': len(pdf_reader.pages),
-                        'metadata': pdf_reader.metadata or {},
-                        'file_size': file_path.stat().st_size
-                    }
-            else:
-                return {'error': 'No PDF library available'}
+            info = dict(_cached_pdf_info(*_stat_key(file_path)))
+            if 'metadata' in info:
+                info['metadata'] = dict(info['metadata'])
+            return info
                 
         except Exception as e:
             logger.error(f"Error getting PDF info for {file_path}: {e}")
-            return {'error': str(e)}
\ No newline at end of file
+            return {'error': str(e)}
+
+
+def _stat_key(file_path: Path) -> Tuple[str, int, int]:
+    """Cache key for PDF info; a rewritten file changes mtime or size"""
+    stat = os.stat(file_path)
+    return str(file_path), stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_pdf_info(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Page count and document metadata, cached per (path, mtime_ns, size); callers must copy"""
+    if pymupdf:
+        with pymupdf.open(path) as doc:
+            return {
+                'page_count': doc.page_count,
+                'metadata': doc.metadata or {},
+                'file_size': size
+            }
+    elif pdfplumber:
+        with pdfplumber.open(path) as pdf:
+            return {
+                'page_count': len(pdf.pages),
+                'metadata': pdf.metadata or {},
+                'file_size': size
+            }
+    elif PyPDF2:
+        with open(path, 'rb') as file:
+            pdf_reader = PyPDF2.PdfReader(file)
+            return {
+                'page_count': len(pdf_reader.pages),
+                'metadata': dict(pdf_reader.metadata or {}),
+                'file_size': size
+            }
+    else:
+        return {'error': 'No PDF library available'}
+
+
+def _is_image_only_page(page) -> bool:
+    """
+    Whether a page only draws images, judged from its content stream
+    
+    A page with no BT operator has no text objects. Image streams are never
+    decoded. Pages that use form XObjects may draw text from inside them, so
+    they are always treated as text pages.
+    """
+    if not page.get_images() or page.get_xobjects():
+        return False
+    return _BEGIN_TEXT.search(page.read_contents()) is None
+
+
+def _extract_pymupdf_page(
+    doc,
+    page_number: int,
+    extract_images: bool = False,
+    skip_image_only_pages: bool = True,
+    return_blocks: bool = False
+) -> _PageResult:
+    """
+    Render one PyMuPDF page as content parts, its image count, whether it was
+    skipped and, with return_blocks, its text blocks with their bounding boxes
+    """
+    page = doc[page_number]
+    
+    # Scanned pages yield no text; skip extraction entirely
+    if skip_image_only_pages and _is_image_only_page(page):
+        return [], len(page.get_images()) if extract_images else 0, True, []
+    
+    page_parts = []
+    blocks = []
+    
+    # Extract text, from the layout blocks when the caller wants them kept
+    if return_blocks:
+        # (x0, y0, x1, y1, text, block_no, block_type); type 0 is text, 1 image
+        blocks = [
+            {'bbox': [x0, y0, x1, y1], 'text': text}
+            for x0, y0, x1, y1, text, _, block_type in page.get_text('blocks')
+            if block_type == 0
+        ]
+        page_text = '\n\n'.join(block['text'] for block in blocks)
+    else:
+        page_text = page.get_text('text')
+    if page_text:
+        page_parts.append(f"[Page {page_number+1}]\n{page_text}\n")
+    
+    # Check for images
+    image_count = 0
+    if extract_images:
+        image_count = len(page.get_images())
+        if image_count:
+            page_parts.append(f"[Page {page_number+1} contains {image_count} images]")
+    
+    return page_parts, image_count, False, blocks
+
+
+def _extract_pymupdf_pages(
+    file_path: str,
+    page_numbers: range,
+    extract_images: bool = False,
+    skip_image_only_pages: bool = True,
+    return_blocks: bool = False
+) -> List[_PageResult]:
+    """Extract a run of pages from one open document; runs in a pool worker process"""
+    with pymupdf.open(file_path) as doc:
+        return [
+            _extract_pymupdf_page(doc, i, extract_images, skip_image_only_pages, return_blocks)
+            for i in page_numbers
+        ]
@@ -3,7 +3,8 @@ Word document processor using python-docx
 """
 
 import logging
-from typing import Dict, Any, Tuple, Union
+import os
+from typing import Dict, Any, List, Optional, Tuple, Union
 from pathlib import Path
 from datetime import datetime
 
@@ -18,13 +19,21 @@ from .base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+# Bytes outside printable ASCII, dropped by the fallback text extraction
+_NON_PRINTABLE = bytes(b for b in range(256) if not 32 <= b <= 126)
+
 
 class WordProcessor(BaseProcessor):
     """Word document processor"""
     
+    # Order in which extracted sections are joined into the content
+    _SECTION_ORDER = ('body', 'tables', 'images', 'headers_footers')
+    
     def __init__(self):
         super().__init__()
         self.supported_extensions = ['.docx', '.doc']
+        # Markdown prefix per paragraph style id, reset for every document
+        self._style_prefix_cache: Dict[Optional[str], str] = {}
         
         if not Document:
             logger.warning("python-docx not installed. Word processing will use fallback method.")
@@ -42,37 +51,44 @@ class WordProcessor(BaseProcessor):
             **kwargs: Additional processing parameters
                 - include_tables: bool = True - Include table content
                 - include_headers_footers: bool = False - Include headers/footers
-                - include_comments: bool = False - Include comments
                 - preserve_formatting: bool = False - Preserve basic formatting
+                - sections_to_return: Optional[List[str]] = None - Only return
+                  these sections (body, tables, images, headers_footers)
         
         Returns:
             Tuple of (content, metadata)
         """
         file_path = Path(source)
         
-        if not await self.validate_source(file_path):
+        stat = self.stat_source(file_path)
+        if stat is None:
             raise FileNotFoundError(f"Word document not found: {file_path}")
         
         include_tables = kwargs.get('include_tables', True)
         include_headers_footers = kwargs.get('include_headers_footers', False)
-        include_comments = kwargs.get('include_comments', False)
         preserve_formatting = kwargs.get('preserve_formatting', False)
+        sections_to_return = kwargs.get('sections_to_return')
+        
+        if kwargs.get('include_comments'):
+            logger.warning("include_comments is not supported for Word documents; comments are not extracted")
         
         try:
             if Document:
                 content, metadata = await self._extract_with_docx(
                     file_path, include_tables, include_headers_footers,
-                    include_comments, preserve_formatting
+                    preserve_formatting, sections_to_return
                 )
             else:
                 # Fallback method
-                content, metadata = await self._extract_fallback(file_path)
+                content, metadata = await self._extract_fallback(file_path, stat)
+                content = self.clean_text(content)
             
             # Add basic file metadata
-            basic_metadata = self.extract_basic_metadata(file_path)
+            basic_metadata = self.extract_basic_metadata(file_path, stat)
             metadata.update(basic_metadata)
             
-            return self.clean_text(content), metadata
+            # The docx extractor cleans each part as it goes
+            return content, metadata
             
         except Exception as e:
             logger.error(f"Error processing Word document {file_path}: {e}")
@@ -83,11 +99,12 @@ class WordProcessor(BaseProcessor):
         file_path: Path,
         include_tables: bool = True,
         include_headers_footers: bool = False,
-        include_comments: bool = False,
-        preserve_formatting: bool = False
+        preserve_formatting: bool = False,
+        sections_to_return: Optional[List[str]] = None
     ) -> Tuple[str, Dict[str, Any]]:
         """Extract content using python-docx"""
-        content_parts = []
+        # Kept apart so callers can drop sections without re-parsing the text
+        sections = {name: [] for name in self._SECTION_ORDER}
         metadata = {
             'extraction_method': 'python_docx',
             'has_tables': False,
@@ -99,6 +116,7 @@ class WordProcessor(BaseProcessor):
         try:
             # Load document
             doc = Document(file_path)
+            self._style_prefix_cache.clear()
             
             # Extract document metadata
             core_props = doc.core_properties
@@ -116,50 +134,42 @@ class WordProcessor(BaseProcessor):
                     'revision': core_props.revision
                 })
             
-            # Extract paragraphs
-            paragraph_count = 0
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text:
-                    if preserve_formatting:
-                        formatted_text = self._extract_paragraph_formatting(paragraph)
-                        content_parts.append(formatted_text)
-                    else:
-                        content_parts.append(text)
-                    paragraph_count += 1
+            # Extract paragraphs, choosing the loop once rather than per paragraph
+            body = sections['body']
+            if preserve_formatting:
+                for paragraph in doc.paragraphs:
+                    text = paragraph.text
+                    if text.strip():
+                        formatted_text = self._extract_paragraph_formatting(paragraph, text)
+                        body.append(self.clean_text(formatted_text))
+            else:
+                for text in (paragraph.text for paragraph in doc.paragraphs):
+                    if text.strip():
+                        body.append(self.clean_text(text))
             
-            metadata['paragraph_count'] = paragraph_count
+            metadata['paragraph_count'] = len(body)
             
             # Extract tables
             if include_tables and doc.tables:
                 metadata['has_tables'] = True
                 metadata['table_count'] = len(doc.tables)
                 
-                content_parts.append("\n## Tables\n")
+                sections['tables'].append("## Tables")
                 for i, table in enumerate(doc.tables):
-                    table_content = self._extract_table_content(table, i + 1)
-                    content_parts.append(table_content)
+                    self._extract_table_content(table, i + 1, sections['tables'])
             
             # Check for images
             if self._has_images(doc):
                 metadata['has_images'] = True
-                content_parts.append("\n[Document contains images]")
+                sections['images'].append("[Document contains images]")
             
             # Extract headers and footers
             if include_headers_footers:
                 headers_footers = self._extract_headers_footers(doc)
                 if headers_footers:
                     metadata['has_headers_footers'] = True
-                    content_parts.append("\n## Headers and Footers\n")
-                    content_parts.append(headers_footers)
-            
-            # Extract comments (if available in the document structure)
-            if include_comments:
-                comments = self._extract_comments(doc)
-                if comments:
-                    metadata['has_comments'] = True
-                    content_parts.append("\n## Comments\n")
-                    content_parts.append(comments)
+                    sections['headers_footers'].append("## Headers and Footers")
+                    sections['headers_footers'].extend(map(self.clean_text, headers_footers))
             
         except InvalidXmlError as e:
             logger.error(f"Invalid Word document format: {e}")
@@ -168,30 +178,49 @@ class WordProcessor(BaseProcessor):
             logger.error(f"Error processing Word document: {e}")
             raise
         
-        return '\n'.join(content_parts), metadata
+        metadata['section_counts'] = {name: len(parts) for name, parts in sections.items()}
+        
+        wanted = self._SECTION_ORDER if sections_to_return is None else sections_to_return
+        content_parts = [
+            part
+            for name in self._SECTION_ORDER if name in wanted
+            for part in sections[name]
+        ]
+        return self.join_cleaned(content_parts), metadata
     
-    def _extract_paragraph_formatting(self, paragraph) -> str:
+    def _extract_paragraph_formatting(self, paragraph, text: Optional[str] = None) -> str:
         """Extract paragraph with basic formatting preserved"""
-        text = paragraph.text
+        if text is None:
+            text = paragraph.text
         
-        # Check paragraph style
-        style_name = paragraph.style.name if paragraph.style else ""
+        # paragraph.style looks the style up in the styles part every time, and
+        # returns a fresh proxy object, so key on the raw style id instead
+        style_id = paragraph._p.style
+        prefix = self._style_prefix_cache.get(style_id)
+        if prefix is None:
+            style_name = paragraph.style.name if paragraph.style else ""
+            prefix = self._style_prefix(style_name or "")
+            self._style_prefix_cache[style_id] = prefix
         
-        # Apply basic markdown formatting based on style
+        return prefix + text
+    
+    @staticmethod
+    def _style_prefix(style_name: str) -> str:
+        """Markdown prefix for a paragraph style name"""
         if "Heading 1" in style_name:
-            return f"# {text}"
+            return "# "
         elif "Heading 2" in style_name:
-            return f"## {text}"
+            return "## "
         elif "Heading 3" in style_name:
-            return f"### {text}"
+            return "### "
         elif "Heading" in style_name:
-            return f"#### {text}"
+            return "#### "
         else:
-            return text
+            return ""
     
-    def _extract_table_content(self, table, table_number: int) -> str:
-        """Extract content from a table"""
-        table_parts = [f"\n### Table {table_number}\n"]
+    def _extract_table_content(self, table, table_number: int, content_parts: list) -> None:
+        """Append the cleaned content of a table to content_parts, one row per part"""
+        content_parts.append(f"### Table {table_number}")
         
         for i, row in enumerate(table.rows):
             row_cells = []
@@ -199,27 +228,20 @@ class WordProcessor(BaseProcessor):
                 cell_text = cell.text.strip().replace('\n', ' ')
                 row_cells.append(cell_text)
             
+            content_parts.append(self.clean_text('| ' + ' | '.join(row_cells) + ' |'))
             if i == 0:  # Header row
-                table_parts.append('| ' + ' | '.join(row_cells) + ' |')
-                table_parts.append('|' + '---|' * len(row_cells))
-            else:
-                table_parts.append('| ' + ' | '.join(row_cells) + ' |')
-        
-        return '\n'.join(table_parts) + '\n'
+                content_parts.append('|' + '---|' * len(row_cells))
     
     def _has_images(self, doc) -> bool:
         """Check if document contains images"""
         try:
             # Check for inline shapes (images)
-            for rel in doc.part.rels.values():
-                if rel.reltype.endswith('/image'):
-                    return True
-            return False
+            return any(rel.reltype.endswith('/image') for rel in doc.part.rels.values())
         except Exception:
             return False
     
-    def _extract_headers_footers(self, doc) -> str:
-        """Extract headers and footers content"""
+    def _extract_headers_footers(self, doc) -> list:
+        """Extract headers and footers content, one line per item"""
         headers_footers = []
         
         try:
@@ -242,15 +264,13 @@ class WordProcessor(BaseProcessor):
         except Exception as e:
             logger.warning(f"Error extracting headers/footers: {e}")
         
-        return '\n'.join(headers_footers)
-    
-    def _extract_comments(self, doc) -> str:
-        """Extract comments from document"""
-        # Note: python-docx doesn't directly support comments extraction
-        # This is a placeholder for future enhancement
-        return ""
+        return headers_footers
     
-    async def _extract_fallback(self, file_path: Path) -> Tuple[str, Dict[str, Any]]:
+    async def _extract_fallback(
+        self,
+        file_path: Path,
+        stat: os.stat_result
+    ) -> Tuple[str, Dict[str, Any]]:
         """Fallback extraction method"""
         logger.warning("Using fallback Word extraction method")
         
@@ -262,14 +282,14 @@ class WordProcessor(BaseProcessor):
         # Simple approach - just indicate Word content
         content = f"Word Document: {file_path.name}\n"
         content += "Content extraction requires python-docx library.\n"
-        content += f"File size: {file_path.stat().st_size} bytes"
+        content += f"File size: {stat.st_size} bytes"
         
         # Try to read as plain text (limited success)
         try:
             with open(file_path, 'rb') as f:
                 # Read first 1000 bytes and try to extract readable text
                 data = f.read(1000)
-                readable_chars = ''.join(chr(b) for b in data if 32 <= b <= 126)
+                readable_chars = data.translate(None, _NON_PRINTABLE).decode('ascii')
                 if len(readable_chars) > 50:
                     content += f"\n\nPartial content (plain text extraction):\n{readable_chars[:200]}..."
         except Exception:
@@ -11,7 +11,7 @@ import uvicorn
 from fastapi import FastAPI
 from prometheus_client import make_asgi_app
 
-from .api.routes import router as api_router
+from .api.routes import router as api_router, close_ingestion_pipeline
 from .config import settings
 from .core.database import init_databases, close_databases
 from .core.logging import setup_logging
@@ -37,6 +37,7 @@ async def lifespan(app: FastAPI):
     
     # Cleanup
     logger.info("Shutting down DataLive Unified Agent...")
+    close_ingestion_pipeline()
     await close_databases()
     logger.info("Cleanup complete")
 
@@ -79,11 +80,15 @@ async def status_check():
 
 def main():
     """Main function to run the server"""
+    # One process unless API_WORKERS asks for more; reload only works with a
+    # single process. Each worker opens its own database pools in lifespan.
+    workers = 1 if settings.debug else settings.api_workers
     uvicorn.run(
         "src.main:app",
         host=settings.api_host,
         port=settings.api_port,
         reload=settings.debug,
+        workers=workers,
         log_level=settings.log_level.lower()
     )
 
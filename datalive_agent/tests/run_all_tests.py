@@ -4,85 +4,224 @@ Comprehensive Test Runner for DataLive Agent
 Runs all tests and generates coverage reports
 """
 
+import functools
+import importlib.util
 import subprocess
 import sys
 import os
 import asyncio
+import threading
 from pathlib import Path
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Seconds before a suite or command is killed; --timeout=N overrides it
+_DEFAULT_TIMEOUT = 300
+
+# Only the end of each command's output is kept for the summary report
+_OUTPUT_TAIL_LINES = 200
+
+
+@functools.lru_cache(maxsize=None)
+def _is_importable(name: str) -> bool:
+    """Whether a module can be imported; find_spec locates it without running it"""
+    return importlib.util.find_spec(name) is not None
+
+
+def _drain(pipe, tail: deque, echo_to=None):
+    """Read a child's output pipe line by line into tail, echoing it live if asked"""
+    for line in pipe:
+        if echo_to is not None:
+            echo_to.write(line)
+            echo_to.flush()
+        tail.append(line)
+    pipe.close()
 
 
 class TestRunner:
     """Test runner with reporting and metrics"""
     
-    def __init__(self):
+    # Everything except the suites below, which run alongside it
+    UNIT_TESTS = [
+        "tests/",
+        "--ignore=tests/test_integration.py",
+        "--ignore=tests/test_database_integration.py",
+        "--ignore=tests/test_agents_performance.py",
+        "--ignore=tests/test_cache_performance.py",
+        "--ignore=tests/test_api_security.py",
+        "-v", "--tb=short"
+    ]
+    INTEGRATION_TESTS = ["tests/test_integration.py", "tests/test_database_integration.py", "-v", "--tb=short"]
+    PERFORMANCE_TESTS = ["tests/test_agents_performance.py", "tests/test_cache_performance.py", "-v", "--tb=short"]
+    SECURITY_TESTS = ["tests/test_api_security.py", "-v", "--tb=short"]
+    COVERAGE_TESTS = ["tests/", "--cov=src", "--cov-report=html", "--cov-report=term-missing", "--cov-report=xml"]
+    
+    def __init__(self, timeout: float = _DEFAULT_TIMEOUT):
         self.test_dir = Path(__file__).parent
         self.project_root = self.test_dir.parent
         self.results = {}
+        self.timeout = timeout
+        self._deps_checked: Optional[bool] = None
     
     def run_command(self, command: str, description: str):
         """Run a command and capture results"""
+        self._print_header(command, description)
+        result = self._execute(command, echo=True, timeout=self.timeout)
+        return self._record(description, result)
+    
+    def run_pytest(self, args: List[str], description: str):
+        """Run a pytest suite and capture results"""
+        self._print_header(self._pytest_command(args), description)
+        result = self._execute_pytest(args, echo=True, timeout=self.timeout)
+        return self._record(description, result)
+    
+    def run_pytest_parallel(self, suites: List[Tuple[List[str], str]]):
+        """
+        Run independent (pytest args, description) suites concurrently
+        
+        Each suite runs in its own process, so the threads only wait on them.
+        Results are printed and recorded in the order the suites finish.
+        """
+        all_passed = True
+        with ThreadPoolExecutor(max_workers=min(len(suites), os.cpu_count() or 1)) as pool:
+            futures = {
+                pool.submit(self._execute_pytest, args, False, self.timeout): (args, description)
+                for args, description in suites
+            }
+            for future in as_completed(futures):
+                args, description = futures[future]
+                self._print_header(self._pytest_command(args), description)
+                all_passed &= self._record(description, future.result())
+        return all_passed
+    
+    @staticmethod
+    def _pytest_command(args: List[str]) -> str:
+        """Shell form of a pytest run, for display"""
+        return "python -m pytest " + " ".join(args)
+    
+    def _print_header(self, command: str, description: str):
+        """Print the banner shown before a command's output"""
         print(f"\n{'='*60}")
         print(f"🧪 {description}")
         print(f"{'='*60}")
         print(f"Command: {command}")
         print()
+    
+    def _execute(
+        self,
+        command: Union[str, List[str]],
+        echo: bool = False,
+        timeout: float = _DEFAULT_TIMEOUT
+    ) -> Dict[str, Any]:
+        """
+        Run a command and return its result entry
         
+        A string command runs through the shell, a list runs directly. Output
+        is read as it arrives and only the last _OUTPUT_TAIL_LINES lines of
+        each stream are kept; with echo it is also printed live.
+        """
         start_time = time.time()
         
         try:
-            result = subprocess.run(
+            process = subprocess.Popen(
                 command,
-                shell=True,
+                shell=isinstance(command, str),
                 cwd=self.project_root,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=300  # 5 minute timeout
+                bufsize=1
             )
+            stdout_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+            stderr_tail = deque(maxlen=_OUTPUT_TAIL_LINES)
+            readers = [
+                threading.Thread(target=_drain, args=(process.stdout, stdout_tail, sys.stdout if echo else None)),
+                threading.Thread(target=_drain, args=(process.stderr, stderr_tail, sys.stderr if echo else None)),
+            ]
+            for reader in readers:
+                reader.start()
+            
+            try:
+                process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+            finally:
+                for reader in readers:
+                    reader.join()
             
             end_time = time.time()
             duration = end_time - start_time
             
-            print(result.stdout)
-            if result.stderr:
-                print("STDERR:")
-                print(result.stderr)
-            
-            success = result.returncode == 0
-            self.results[description] = {
-                'success': success,
+            return {
+                'success': process.returncode == 0,
                 'duration': duration,
-                'return_code': result.returncode,
-                'stdout': result.stdout,
-                'stderr': result.stderr
+                'return_code': process.returncode,
+                'stdout': ''.join(stdout_tail),
+                'stderr': ''.join(stderr_tail),
+                'streamed': echo
             }
             
-            status = "✅ PASSED" if success else "❌ FAILED"
-            print(f"\n{status} - Duration: {duration:.2f}s")
-            
-            return success
-            
         except subprocess.TimeoutExpired:
-            print("❌ TIMEOUT - Test took longer than 5 minutes")
-            self.results[description] = {
+            return {
                 'success': False,
-                'duration': 300,
+                'duration': timeout,
                 'return_code': -1,
                 'error': 'timeout'
             }
-            return False
         except Exception as e:
-            print(f"❌ ERROR - {str(e)}")
-            self.results[description] = {
+            return {
                 'success': False,
                 'duration': 0,
                 'return_code': -1,
                 'error': str(e)
             }
+    
+    def _execute_pytest(
+        self,
+        args: List[str],
+        echo: bool = False,
+        timeout: float = _DEFAULT_TIMEOUT
+    ) -> Dict[str, Any]:
+        """
+        Run pytest in a fresh interpreter and return its result entry
+        
+        Each suite gets its own process, so coverage, imports and module
+        state never leak between suites running side by side.
+        """
+        return self._execute([sys.executable, '-m', 'pytest', *args], echo=echo, timeout=timeout)
+    
+    def _record(self, description: str, result: Dict[str, Any]) -> bool:
+        """Print a command's outcome and store it in self.results"""
+        self.results[description] = result
+        
+        if result.get('error') == 'timeout':
+            print(f"❌ TIMEOUT - Test took longer than {result['duration']:.0f}s")
+            return False
+        if 'error' in result:
+            print(f"❌ ERROR - {result['error']}")
             return False
+        
+        # Streamed output was already printed as it arrived
+        if not result.get('streamed'):
+            print(result['stdout'])
+            if result['stderr']:
+                print("STDERR:")
+                print(result['stderr'])
+        
+        status = "✅ PASSED" if result['success'] else "❌ FAILED"
+        print(f"\n{status} - Duration: {result['duration']:.2f}s")
+        
+        return result['success']
     
     def check_dependencies(self):
-        """Check if testing dependencies are available"""
+        """Check if testing dependencies are available, once per runner"""
+        if self._deps_checked is not None:
+            return self._deps_checked
+        
         print("🔍 Checking test dependencies...")
         
         # Check Python packages
@@ -93,53 +232,53 @@ class TestRunner:
             'coverage'
         ]
         
-        missing_packages = []
-        for package in required_packages:
-            try:
-                __import__(package.replace('-', '_'))
-            except ImportError:
-                missing_packages.append(package)
+        missing_packages = [
+            package for package in required_packages
+            if not _is_importable(package.replace('-', '_'))
+        ]
         
         if missing_packages:
             print(f"❌ Missing packages: {', '.join(missing_packages)}")
             print("Install with: pip install pytest pytest-asyncio pytest-cov coverage")
-            return False
+            self._deps_checked = False
+        else:
+            print("✅ All required packages available")
+            self._deps_checked = True
         
-        print("✅ All required packages available")
-        return True
+        return self._deps_checked
     
     def run_unit_tests(self):
         """Run unit tests"""
-        return self.run_command(
-            "python -m pytest tests/ -v --tb=short",
+        return self.run_pytest(
+            self.UNIT_TESTS,
             "Unit Tests"
         )
     
     def run_integration_tests(self):
         """Run integration tests"""
-        return self.run_command(
-            "python -m pytest tests/test_integration.py tests/test_database_integration.py -v --tb=short",
+        return self.run_pytest(
+            self.INTEGRATION_TESTS,
             "Integration Tests"
         )
     
     def run_performance_tests(self):
         """Run performance tests"""
-        return self.run_command(
-            "python -m pytest tests/test_agents_performance.py tests/test_cache_performance.py -v --tb=short",
+        return self.run_pytest(
+            self.PERFORMANCE_TESTS,
             "Performance Tests"
         )
     
     def run_security_tests(self):
         """Run security tests"""
-        return self.run_command(
-            "python -m pytest tests/test_api_security.py -v --tb=short",
+        return self.run_pytest(
+            self.SECURITY_TESTS,
             "Security Tests"
         )
     
     def run_with_coverage(self):
         """Run all tests with coverage"""
-        return self.run_command(
-            "python -m pytest tests/ --cov=src --cov-report=html --cov-report=term-missing --cov-report=xml",
+        return self.run_pytest(
+            self.COVERAGE_TESTS,
             "Coverage Analysis"
         )
     
@@ -156,12 +295,14 @@ class TestRunner:
             ("test_unified_agent.py", "Unified Agent Tests")
         ]
         
+        # One directory listing instead of a stat per test file
+        present = {entry.name for entry in os.scandir(self.test_dir) if entry.is_file()}
+        
         results = {}
         for test_file, description in test_files:
-            test_path = self.test_dir / test_file
-            if test_path.exists():
-                success = self.run_command(
-                    f"python -m pytest tests/{test_file} -v",
+            if test_file in present:
+                success = self.run_pytest(
+                    [f"tests/{test_file}", "-v"],
                     description
                 )
                 results[test_file] = success
@@ -242,11 +383,13 @@ class TestRunner:
         all_passed = True
         
         if not quick_mode:
-            # Run comprehensive test suite
-            all_passed &= self.run_unit_tests()
-            all_passed &= self.run_integration_tests()
-            all_passed &= self.run_performance_tests()
-            all_passed &= self.run_security_tests()
+            # Run comprehensive test suite; the independent suites run side by side
+            all_passed &= self.run_pytest_parallel([
+                (self.UNIT_TESTS, "Unit Tests"),
+                (self.INTEGRATION_TESTS, "Integration Tests"),
+                (self.PERFORMANCE_TESTS, "Performance Tests"),
+                (self.SECURITY_TESTS, "Security Tests"),
+            ])
             all_passed &= self.run_with_coverage()
             
             # Run lint checks
@@ -263,20 +406,23 @@ class TestRunner:
 
 def main():
     """Main entry point"""
-    runner = TestRunner()
-    
     # Parse command line arguments
     quick_mode = '--quick' in sys.argv
     specific_test = None
+    timeout = _DEFAULT_TIMEOUT
     
     for arg in sys.argv[1:]:
         if arg.startswith('--test='):
             specific_test = arg.split('=')[1]
+        elif arg.startswith('--timeout='):
+            timeout = float(arg.split('=')[1])
+    
+    runner = TestRunner(timeout=timeout)
     
     if specific_test:
         # Run specific test
-        success = runner.run_command(
-            f"python -m pytest tests/{specific_test} -v",
+        success = runner.run_pytest(
+            [f"tests/{specific_test}", "-v"],
             f"Specific Test: {specific_test}"
         )
         runner.generate_summary_report()
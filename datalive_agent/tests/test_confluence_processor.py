@@ -0,0 +1,58 @@
+import pytest
+from src.ingestion.processors import confluence_processor
+from src.ingestion.processors.confluence_processor import ConfluenceProcessor
+
+# Storage-format pages without macros or entities, where both conversions must agree
+PLAIN_HTML_FIXTURES = {
+    'headings': '<h1>Title</h1><p>Intro with <strong>bold</strong> and <em>emph</em>.</p>'
+                '<h2>Next</h2><p>Line one<br/>Line two</p>',
+    'lists': '<p>Items:</p><ul><li>one</li><li>two <strong>b</strong></li></ul><ol><li>first</li></ol>',
+    'table': '<table><tbody><tr><th>A</th><th>B</th></tr><tr><td>1</td><td>2</td></tr></tbody></table>'
+             '<p>After</p>',
+    'xml_declaration': '<?xml version="1.0" encoding="UTF-8"?><p>Body   with   spaces</p>\n\n\n<p>Next</p>',
+    'layout': '<ac:layout><ac:layout-section ac:type="single"><ac:layout-cell><p>Cell text</p>'
+              '</ac:layout-cell></ac:layout-section></ac:layout>',
+}
+
+
+def convert_both(html_content, monkeypatch):
+    """Convert with the lxml tree walk and with the regex conversion"""
+    processor = ConfluenceProcessor()
+    tree_text = processor._html_to_text(html_content)
+
+    monkeypatch.setattr(confluence_processor, 'lxml_html', None)
+    regex_text = processor._html_to_text(html_content)
+    monkeypatch.undo()
+
+    return tree_text, regex_text
+
+
+@pytest.mark.skipif(confluence_processor.lxml_html is None, reason="lxml not installed")
+class TestConfluenceHtmlToText:
+    @pytest.mark.parametrize("html_content", PLAIN_HTML_FIXTURES.values(), ids=PLAIN_HTML_FIXTURES.keys())
+    def test_matches_regex_conversion(self, html_content, monkeypatch):
+        """Test the lxml walk gives the same text as the regex conversion."""
+        tree_text, regex_text = convert_both(html_content, monkeypatch)
+
+        assert tree_text == regex_text
+
+    def test_macro_configuration_is_dropped(self, monkeypatch):
+        """Test macro parameters are dropped and CDATA code bodies are kept."""
+        html_content = (
+            '<ac:structured-macro ac:name="code">'
+            '<ac:parameter ac:name="language">python</ac:parameter>'
+            '<ac:plain-text-body><![CDATA[print("x")]]></ac:plain-text-body>'
+            '</ac:structured-macro><p>Text</p>'
+        )
+
+        tree_text, regex_text = convert_both(html_content, monkeypatch)
+
+        assert regex_text == 'python\nText'
+        assert tree_text == 'print("x")\nText'
+
+    def test_entities_are_decoded(self, monkeypatch):
+        """Test character references become text instead of staying escaped."""
+        tree_text, regex_text = convert_both('<p>Fish &amp; chips &lt;3</p>', monkeypatch)
+
+        assert regex_text == 'Fish &amp; chips &lt;3'
+        assert tree_text == 'Fish & chips <3'
@@ -0,0 +1,222 @@
+import csv
+import io
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from src.ingestion.processors import csv_processor
+from src.ingestion.processors.csv_processor import CSVProcessor
+
+# Values that type inference would rewrite: leading zeros, trailing zeros,
+# thousands separators, yes/no flags, non-ISO dates and null-like tokens
+MIXED_CSV = (
+    "zip,price,amount,active,flag,signup,note\n"
+    '00501,12.50,"1,234",true,yes,01/02/2023,NA\n'
+    '02134,3.00,"12,000.75",false,no,03/04/2023,\n'
+    '10001,7.25,"987",True,y,2023-05-06,"multi\nline"\n'
+    ',0.50,"5,5",FALSE,n,,N/A\n'
+)
+
+# Keys that legitimately differ between the two readers
+VOLATILE_KEYS = {'extraction_method', 'created_at'}
+
+
+async def extract_both(source, monkeypatch, **kwargs):
+    """Run the Arrow reader and the csv-module reader on the same source"""
+    arrow = await CSVProcessor().extract_content(source, **kwargs)
+
+    monkeypatch.setattr(csv_processor, 'pa_csv', None)
+    fallback = await CSVProcessor().extract_content(source, **kwargs)
+    monkeypatch.undo()
+
+    return arrow, fallback
+
+
+def stable(metadata):
+    """Metadata without the fields that differ on every run or per reader"""
+    return {key: value for key, value in metadata.items() if key not in VOLATILE_KEYS}
+
+
+@pytest.mark.skipif(csv_processor.pa_csv is None, reason="pyarrow not installed")
+class TestCSVArrowParity:
+    @pytest.mark.asyncio
+    async def test_file_matches_csv_module(self, tmp_path, monkeypatch):
+        """Test the Arrow and csv-module paths give identical output for a file."""
+        path = tmp_path / "mixed.csv"
+        path.write_text(MIXED_CSV, encoding="utf-8")
+
+        (arrow_text, arrow_meta), (csv_text, csv_meta) = await extract_both(str(path), monkeypatch)
+
+        assert arrow_meta['extraction_method'] == 'arrow_csv'
+        assert csv_meta['extraction_method'] == 'csv_parse'
+        assert arrow_text == csv_text
+        assert stable(arrow_meta) == stable(csv_meta)
+
+    @pytest.mark.asyncio
+    async def test_values_are_not_retyped(self, tmp_path):
+        """Test cell text survives unchanged and types come from the value heuristics."""
+        path = tmp_path / "mixed.csv"
+        path.write_text(MIXED_CSV, encoding="utf-8")
+
+        text, metadata = await CSVProcessor().extract_content(str(path))
+
+        assert metadata['sample_data'][0][:6] == ['00501', '12.50', '1,234', 'true', 'yes', '01/02/2023']
+        assert metadata['sample_data'][0][6] == 'NA'
+        assert metadata['estimated_data_types']['amount'] == 'numeric'
+        assert metadata['estimated_data_types']['flag'] == 'boolean'
+        assert metadata['estimated_data_types']['signup'] == 'date'
+        assert "zip: 00501" in text
+
+    @pytest.mark.asyncio
+    async def test_content_matches_csv_module(self, monkeypatch):
+        """Test the two paths agree on in-memory CSV content."""
+        (arrow_text, arrow_meta), (csv_text, csv_meta) = await extract_both(MIXED_CSV, monkeypatch)
+
+        assert arrow_text == csv_text
+        assert stable(arrow_meta) == stable(csv_meta)
+
+    @pytest.mark.asyncio
+    async def test_semicolon_file_with_many_rows(self, tmp_path, monkeypatch):
+        """Test parity past the preview and sample windows, with a sniffed delimiter."""
+        rows = [f"{i:05d};{i * 1.5:.2f};{'yes' if i % 2 else 'no'};café {i}" for i in range(250)]
+        path = tmp_path / "many.csv"
+        path.write_text("id;value;flag;label\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+        (arrow_text, arrow_meta), (csv_text, csv_meta) = await extract_both(
+            str(path), monkeypatch, max_rows=200, sample_rows=50
+        )
+
+        assert arrow_meta['row_count'] == 200
+        assert arrow_text == csv_text
+        assert stable(arrow_meta) == stable(csv_meta)
+
+    @pytest.mark.asyncio
+    async def test_blank_lines_fall_back_to_csv_module(self, tmp_path):
+        """Test blank lines, which the csv module counts as records, use the csv-module path."""
+        path = tmp_path / "blank.csv"
+        path.write_text("a,b\n1,2\n\n3,4\n", encoding="utf-8")
+
+        _, metadata = await CSVProcessor().extract_content(str(path))
+
+        assert metadata['extraction_method'] == 'csv_parse'
+        assert metadata['row_count'] == 3
+
+
+class TestCSVSharedExecutor:
+    @pytest.mark.asyncio
+    async def test_pool_matches_in_process(self, tmp_path, monkeypatch):
+        """Test a file parsed in the shared process pool matches an in-process parse."""
+        path = tmp_path / "mixed.csv"
+        path.write_text(MIXED_CSV, encoding="utf-8")
+
+        in_process_text, in_process_meta = await CSVProcessor().extract_content(str(path))
+
+        monkeypatch.setattr(csv_processor, '_PARALLEL_MIN_FILE_SIZE', 0)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn')) as pool:
+            processor = CSVProcessor()
+            processor.executor = pool
+            pooled_text, pooled_meta = await processor.extract_content(str(path))
+
+        assert pooled_text == in_process_text
+        assert stable(pooled_meta) == stable(in_process_meta)
+
+
+# Ragged rows, whitespace-only cells and a column with more than ten typed values
+RAGGED_CSV = (
+    "id,score,when,label\n"
+    + "".join(f"{i},{i * 0.5},2023-01-{i + 1:02d},item {i % 4}\n" for i in range(14))
+    + "14,  ,\n"
+    + "15\n"
+    + "16,yes,01/02/2023,   \n"
+)
+
+
+def previous_is_numeric(value):
+    """The numeric check as implemented with a float() attempt"""
+    try:
+        float(value.replace(',', ''))
+        return True
+    except ValueError:
+        return False
+
+
+def reference_analysis(headers, sample_rows):
+    """The column analysis as computed before statistics were gathered during parsing"""
+    if not headers or not sample_rows:
+        return {'quality_score': 0.0, 'empty_cells': 0}
+
+    analysis = {}
+    total_cells = 0
+    empty_cells = 0
+
+    for col_idx, header in enumerate(headers):
+        col_data = []
+        col_empty = 0
+        for row in sample_rows:
+            if col_idx < len(row) and row[col_idx].strip():
+                col_data.append(row[col_idx])
+            else:
+                col_empty += 1
+                empty_cells += 1
+            total_cells += 1
+
+        numeric_count = date_count = boolean_count = 0
+        for value in col_data[:10]:
+            value = value.strip()
+            if previous_is_numeric(value):
+                numeric_count += 1
+            elif value.lower() in ['true', 'false', 'yes', 'no', '1', '0', 'y', 'n']:
+                boolean_count += 1
+            elif any(char in value for char in ['/', '-']) and any(char.isdigit() for char in value):
+                if len(value.split('/')) == 3 or len(value.split('-')) == 3:
+                    date_count += 1
+
+        total = len(col_data[:10])
+        if not col_data:
+            data_type = 'empty'
+        elif numeric_count / total > 0.7:
+            data_type = 'numeric'
+        elif date_count / total > 0.7:
+            data_type = 'date'
+        elif boolean_count / total > 0.7:
+            data_type = 'boolean'
+        else:
+            data_type = 'text'
+
+        analysis[header] = {
+            'type': data_type,
+            'sample_values': col_data[:3],
+            'unique_values': len(set(col_data)),
+            'empty_count': col_empty,
+            'quality': len(col_data) / (len(col_data) + col_empty)
+        }
+
+    analysis['quality_score'] = (total_cells - empty_cells) / total_cells
+    analysis['empty_cells'] = empty_cells
+    return analysis
+
+
+class TestCSVColumnStatistics:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content", [MIXED_CSV, RAGGED_CSV], ids=["mixed", "ragged"])
+    @pytest.mark.parametrize("sample_rows", [3, 100])
+    async def test_matches_previous_analysis(self, content, sample_rows, tmp_path, monkeypatch):
+        """Test statistics gathered while parsing equal the previous per-column analysis."""
+        path = tmp_path / "data.csv"
+        path.write_text(content, encoding="utf-8")
+        processor = CSVProcessor()
+        parsed = list(csv.reader(io.StringIO(content, newline='')))
+        headers = [cell.strip() for cell in parsed[0]]
+        rows = [[cell.strip() for cell in row] for row in parsed[1:]]
+
+        monkeypatch.setattr(csv_processor, 'pa_csv', None)
+        _, metadata = await processor.extract_content(str(path), sample_rows=sample_rows)
+
+        assert metadata['column_analysis'] == reference_analysis(headers, rows[:sample_rows])
+
+    @pytest.mark.parametrize("value", ["nan", "NaN", "inf", "-Infinity", "1_000"])
+    def test_float_only_spellings_are_not_numeric(self, value):
+        """Test spellings float() accepts but that are not decimal numbers are no longer numeric."""
+        assert previous_is_numeric(value)
+        assert not CSVProcessor()._is_numeric(value)
+        assert CSVProcessor()._classify_value(value) is None
@@ -0,0 +1,105 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from src.ingestion.processors import excel_processor
+from src.ingestion.processors.excel_processor import ExcelProcessor
+
+openpyxl = excel_processor.openpyxl
+
+
+def write_workbook(path, value):
+    """One-sheet workbook with a header and a single row"""
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["name", "amount"])
+    workbook.active.append([value, 1])
+    workbook.save(path)
+    return path
+
+
+def cached_processor(cache_dir, max_bytes=1024 * 1024):
+    """An ExcelProcessor with the extraction cache enabled"""
+    processor = ExcelProcessor()
+    processor.cache_dir = cache_dir
+    processor.cache_max_bytes = max_bytes
+    return processor
+
+
+@pytest.mark.skipif(openpyxl is None or excel_processor.pd is None, reason="openpyxl/pandas not installed")
+class TestExcelCache:
+    @pytest.mark.asyncio
+    async def test_cache_disabled_by_default(self, tmp_path, monkeypatch):
+        """Test nothing is cached unless a cache directory is configured."""
+        monkeypatch.setattr(excel_processor.settings, 'excel_cache_dir', None)
+        path = write_workbook(tmp_path / "book.xlsx", "alpha")
+
+        processor = ExcelProcessor()
+        content, _ = await processor.extract_content(path)
+
+        assert processor.cache_dir is None
+        assert "alpha" in content
+
+    @pytest.mark.asyncio
+    async def test_hit_and_invalidation(self, tmp_path, monkeypatch):
+        """Test a cached result is reused and a rewritten workbook is re-read."""
+        cache_dir = tmp_path / "cache"
+        path = write_workbook(tmp_path / "book.xlsx", "alpha")
+        processor = cached_processor(cache_dir)
+
+        first, _ = await processor.extract_content(path)
+        assert "alpha" in first
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        async def no_parse(*args):
+            raise AssertionError("workbook parsed despite a cache hit")
+
+        monkeypatch.setattr(processor, '_extract_with_pandas_openpyxl', no_parse)
+        cached, _ = await processor.extract_content(path)
+        assert cached == first
+        monkeypatch.undo()
+
+        stat = path.stat()
+        write_workbook(path, "bravo")
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        second, _ = await processor.extract_content(path)
+        assert "bravo" in second
+
+    @pytest.mark.asyncio
+    async def test_cache_is_pruned_to_size(self, tmp_path):
+        """Test the least recently used entries are dropped once the cache is full."""
+        cache_dir = tmp_path / "cache"
+        processor = cached_processor(cache_dir, max_bytes=1)
+
+        for name in ("a", "b", "c"):
+            await processor.extract_content(write_workbook(tmp_path / f"{name}.xlsx", name))
+
+        assert len(list(cache_dir.glob("*.json"))) <= 1
+
+
+@pytest.mark.skipif(openpyxl is None or excel_processor.pd is None, reason="openpyxl/pandas not installed")
+class TestExcelSharedExecutor:
+    @pytest.mark.asyncio
+    async def test_pool_matches_in_process(self, tmp_path, monkeypatch):
+        """Test sheets read through a shared process pool match an in-process read."""
+        path = tmp_path / "sheets.xlsx"
+        workbook = openpyxl.Workbook()
+        for index in range(3):
+            sheet = workbook.create_sheet(f"S{index}")
+            sheet.append(["key", "value"])
+            for row in range(20):
+                sheet.append([f"k{row}", row * index])
+        workbook.save(path)
+
+        in_process = await ExcelProcessor().extract_content(path)
+
+        monkeypatch.setattr(excel_processor, '_PARALLEL_MIN_FILE_SIZE', 0)
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as pool:
+            processor = ExcelProcessor()
+            processor.executor = pool
+            processor.executor_workers = 2
+            pooled = await processor.extract_content(path)
+
+        assert pooled[0] == in_process[0]
+        assert pooled[1]['sheets'] == in_process[1]['sheets']
@@ -0,0 +1,147 @@
+import json
+import re
+
+import pytest
+from src.ingestion.processors import markdown_processor
+from src.ingestion.processors.markdown_processor import MarkdownProcessor
+
+TYPED_FRONTMATTER = """---
+title: Release notes
+author: Ana
+date: 2024-01-05
+updated: 2024-01-05T10:00:00Z
+version: 1.10
+count: 3
+draft: false
+tags: [release, 2024]
+---
+# Release notes
+
+Body text.
+"""
+
+
+# The chained substitutions _markdown_to_text used before the single-pass regex
+PREVIOUS_SUBSTITUTIONS = [
+    (re.compile(r'```.*?```', re.DOTALL), ''),
+    (re.compile(r'`[^`]+`'), ''),
+    (re.compile(r'#{1,6}\s+'), ''),
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),
+    (re.compile(r'\*([^*]+)\*'), r'\1'),
+    (re.compile(r'_([^_]+)_'), r'\1'),
+    (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1'),
+    (re.compile(r'!\[([^\]]*)\]\([^)]+\)'), r'\1'),
+    (re.compile(r'^[-*+]\s+', re.MULTILINE), ''),
+    (re.compile(r'^\d+\.\s+', re.MULTILINE), ''),
+    (re.compile(r'^\s*\|\s*', re.MULTILINE), ''),
+    (re.compile(r'\s*\|\s*$', re.MULTILINE), ''),
+]
+
+# Documents without images or tables, where both implementations must agree
+PLAIN_TEXT_FIXTURES = {
+    'formatting': "# Title\n\nSome **bold** and *italic* and _under_ text.\n\n"
+                  "## Sub\n\nA [link](http://x) here and `code` inline.\n",
+    'lists': "- one\n- two **b**\n* three\n+ four\n\n1. first\n2. second [l](u)\n",
+    'code': "Intro\n\n```python\nprint('x')\n```\n\nAfter code with `inline`.\n",
+    'nested': "See [**bold link**](http://x) and **[link in bold](y)**.\n",
+    'underscores': "### H3 heading\nParagraph with snake_case_name and 2 * 3 * 4.\n\n"
+                   "Text_with_underscores_here.\n",
+}
+
+
+def previous_markdown_to_text(content):
+    """_markdown_to_text as implemented with chained substitutions"""
+    for pattern, replacement in PREVIOUS_SUBSTITUTIONS:
+        content = pattern.sub(replacement, content)
+    return re.sub(r'\n\s*\n', '\n\n', content).strip()
+
+
+class TestMarkdownToText:
+    @pytest.mark.parametrize("content", PLAIN_TEXT_FIXTURES.values(), ids=PLAIN_TEXT_FIXTURES.keys())
+    def test_matches_chained_substitutions(self, content):
+        """Test the single-pass conversion equals the previous chained substitutions."""
+        assert MarkdownProcessor()._markdown_to_text(content) == previous_markdown_to_text(content)
+
+    def test_images_render_as_alt_text(self):
+        """Test images keep their alt text without the stray '!' the link rule left."""
+        content = "Look ![alt text](img.png) here.\n"
+
+        assert previous_markdown_to_text(content) == "Look !alt text here."
+        assert MarkdownProcessor()._markdown_to_text(content) == "Look alt text here."
+
+    def test_tables_keep_surrounding_blank_lines(self):
+        """Test table borders are stripped without swallowing the blank lines around the table."""
+        content = "Intro\n\n| a | b |\n|---|---|\n| 1 | 2 |\n\nAfter\n"
+
+        assert previous_markdown_to_text(content) == "Intro\na | b\n---|---\n1 | 2\nAfter"
+        assert MarkdownProcessor()._markdown_to_text(content) == "Intro\n\na | b\n---|---\n1 | 2\n\nAfter"
+
+
+# CommonMark documents the line scan understands, where both scanners must agree
+STRUCTURE_FIXTURES = {
+    'headings': "# Title\n\nIntro text.\n\n## Section A\n\nBody.\n\n### Sub A.1\n\nMore.\n\n## Section B\n",
+    'links': "# Links\n\nSee [docs](https://example.com/docs) and [local](./other.md).\n\n"
+             "Also [mail](mailto:a@b.c) and ![logo](img/logo.png).\n",
+    'code': "# Code\n\n```python\nprint('hi')\n```\n\nText with `inline` code.\n\n```\nplain\n```\n",
+    'lists_tables': "# Data\n\n- one\n- two\n\n1. first\n2. second\n\n| a | b |\n|---|---|\n| 1 | 2 |\n",
+}
+
+
+def without_timestamps(metadata):
+    """Metadata without the creation time, which differs on every run"""
+    return {key: value for key, value in metadata.items() if key != 'created_at'}
+
+
+@pytest.mark.skipif(markdown_processor._MARKDOWN_PARSER is None, reason="markdown-it-py not installed")
+class TestMarkdownTokenScan:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("content", STRUCTURE_FIXTURES.values(), ids=STRUCTURE_FIXTURES.keys())
+    async def test_matches_line_scan(self, content, monkeypatch):
+        """Test the markdown-it token scan gives the same metadata as the line scan."""
+        processor = MarkdownProcessor()
+        tokens_text, tokens_meta = await processor._process_markdown_content(content)
+
+        monkeypatch.setattr(markdown_processor, '_MARKDOWN_PARSER', None)
+        lines_text, lines_meta = await processor._process_markdown_content(content)
+
+        assert tokens_text == lines_text
+        assert without_timestamps(tokens_meta) == without_timestamps(lines_meta)
+
+    def test_finds_constructs_the_line_scan_misses(self):
+        """Test setext headings, reference links and indented code come from the token scan."""
+        content = "Title\n=====\n\nSee [the docs][ref].\n\n    indented code\n\n[ref]: https://example.com\n"
+
+        structure, links, code_blocks = MarkdownProcessor()._scan_markdown_tokens(content)
+
+        assert structure['headings'] == [{'level': 1, 'text': 'Title', 'anchor': 'title'}]
+        assert links['external'] == [{'text': 'the docs', 'url': 'https://example.com'}]
+        assert code_blocks == [{'language': '', 'code': 'indented code', 'type': 'indented'}]
+
+
+class TestMarkdownFrontmatter:
+    @pytest.mark.asyncio
+    async def test_dates_and_numbers_stay_text(self):
+        """Test typed-looking frontmatter values keep their source text and serialize to JSON."""
+        _, metadata = await MarkdownProcessor()._process_markdown_content(TYPED_FRONTMATTER)
+
+        assert metadata['frontmatter'] == {
+            'title': 'Release notes',
+            'author': 'Ana',
+            'date': '2024-01-05',
+            'updated': '2024-01-05T10:00:00Z',
+            'version': '1.10',
+            'count': '3',
+            'draft': 'false',
+            'tags': ['release', '2024'],
+        }
+        assert metadata['tags'] == ['release', '2024']
+        json.dumps(metadata['frontmatter'])
+
+    @pytest.mark.skipif(markdown_processor.yaml is None, reason="PyYAML not installed")
+    def test_yaml_matches_simple_parser_on_flat_frontmatter(self):
+        """Test PyYAML and the key/value fallback agree on flat frontmatter."""
+        processor = MarkdownProcessor()
+        frontmatter = processor._extract_frontmatter(TYPED_FRONTMATTER)
+        block = TYPED_FRONTMATTER.split('---\n')[1]
+
+        assert frontmatter['data'] == processor._parse_simple_frontmatter(block)
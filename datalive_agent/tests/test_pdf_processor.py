@@ -0,0 +1,135 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from src.ingestion.processors import pdf_processor
+from src.ingestion.processors.pdf_processor import PDFProcessor, _is_image_only_page
+
+pymupdf = pdf_processor.pymupdf
+
+
+def write_pdf(path):
+    """Three pages: text only, a full-page image, and an image with a caption"""
+    pixmap = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 20, 20), False)
+    pixmap.clear_with(200)
+
+    with pymupdf.open() as doc:
+        page = doc.new_page()
+        page.insert_text((72, 72), "Plain text page")
+        page = doc.new_page()
+        page.insert_image(page.rect, pixmap=pixmap)
+        page = doc.new_page()
+        page.insert_image(pymupdf.Rect(0, 0, 50, 50), pixmap=pixmap)
+        page.insert_text((72, 200), "Image caption")
+        doc.save(str(path))
+    return path
+
+
+@pytest.mark.skipif(pymupdf is None, reason="PyMuPDF not installed")
+class TestPDFImageOnlyPages:
+    def test_detects_image_only_pages(self, tmp_path):
+        """Test only the page without a text object is image-only."""
+        path = write_pdf(tmp_path / "mixed.pdf")
+
+        with pymupdf.open(str(path)) as doc:
+            assert [_is_image_only_page(page) for page in doc] == [False, True, False]
+
+    @pytest.mark.asyncio
+    async def test_skipped_pages_add_no_text(self, tmp_path):
+        """Test skipped pages contribute no content and are listed in metadata."""
+        path = write_pdf(tmp_path / "mixed.pdf")
+
+        text, metadata = await PDFProcessor()._extract_with_pymupdf(path)
+
+        assert text == "[Page 1] Plain text page [Page 3] Image caption"
+        assert metadata['skipped_pages'] == [2]
+        assert metadata['has_images'] is False
+
+    @pytest.mark.asyncio
+    async def test_images_reported_only_when_requested(self, tmp_path):
+        """Test has_images follows extract_images, skipped pages included."""
+        path = write_pdf(tmp_path / "scan.pdf")
+
+        _, metadata = await PDFProcessor()._extract_with_pymupdf(path, extract_images=True)
+
+        assert metadata['skipped_pages'] == [2]
+        assert metadata['has_images'] is True
+
+
+@pytest.mark.skipif(pymupdf is None, reason="PyMuPDF not installed")
+class TestPDFSharedExecutor:
+    @pytest.mark.asyncio
+    async def test_pool_matches_in_process(self, tmp_path, monkeypatch):
+        """Test pages extracted in the shared process pool match an in-process extraction."""
+        path = tmp_path / "long.pdf"
+        with pymupdf.open() as doc:
+            for number in range(25):
+                doc.new_page().insert_text((72, 72), f"Page body {number}")
+            doc.save(str(path))
+
+        in_process = await PDFProcessor().extract_content(path)
+
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as pool:
+            processor = PDFProcessor()
+            processor.executor = pool
+            processor.executor_workers = 2
+            # Spawned workers import their own copy; in this process, page extraction must not run
+            monkeypatch.setattr(pdf_processor, '_extract_pymupdf_page', None)
+            pooled = await processor.extract_content(path)
+
+        assert pooled[0] == in_process[0]
+        assert pooled[1]['skipped_pages'] == in_process[1]['skipped_pages']
+
+
+def write_titled_pdf(path, title, pages, mtime_ns):
+    """A PDF with the given title and number of blank pages, saved with a fixed mtime"""
+    with pymupdf.open() as doc:
+        for _ in range(pages):
+            doc.new_page()
+        doc.set_metadata({'title': title})
+        doc.save(str(path))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.mark.skipif(pymupdf is None, reason="PyMuPDF not installed")
+class TestPDFInfoCache:
+    def setup_method(self):
+        pdf_processor._cached_pdf_info.cache_clear()
+
+    def test_unchanged_file_is_cached(self, tmp_path):
+        """Test repeated lookups of an unchanged file open it once."""
+        path = tmp_path / "doc.pdf"
+        write_titled_pdf(path, "Alpha", 1, 1_000_000_000)
+
+        PDFProcessor().get_pdf_info(path)
+        info = PDFProcessor().get_pdf_info(path)
+
+        assert info['page_count'] == 1
+        assert pdf_processor._cached_pdf_info.cache_info().hits == 1
+
+    def test_changed_mtime_invalidates(self, tmp_path):
+        """Test a same-size rewrite with a new mtime is read again."""
+        path = tmp_path / "doc.pdf"
+        write_titled_pdf(path, "Alpha", 1, 1_000_000_000)
+        before = PDFProcessor().get_pdf_info(path)
+        size = path.stat().st_size
+
+        write_titled_pdf(path, "Bravo", 1, 2_000_000_000)
+        assert path.stat().st_size == size
+        after = PDFProcessor().get_pdf_info(path)
+
+        assert before['metadata']['title'] == "Alpha"
+        assert after['metadata']['title'] == "Bravo"
+
+    def test_changed_size_invalidates(self, tmp_path):
+        """Test a rewrite that keeps the mtime but changes the size is read again."""
+        path = tmp_path / "doc.pdf"
+        write_titled_pdf(path, "Alpha", 1, 1_000_000_000)
+        before = PDFProcessor().get_pdf_info(path)
+
+        write_titled_pdf(path, "Alpha", 3, 1_000_000_000)
+        after = PDFProcessor().get_pdf_info(path)
+
+        assert before['page_count'] == 1
+        assert after['page_count'] == 3
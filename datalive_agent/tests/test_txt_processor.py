@@ -0,0 +1,71 @@
+import os
+
+import pytest
+from src.ingestion.processors import txt_processor
+from src.ingestion.processors.txt_processor import TXTProcessor
+
+
+def rewrite(path, text, mtime_ns):
+    """Replace a file's contents and set its modification time"""
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture(autouse=True)
+def empty_profile_cache():
+    txt_processor._PROFILE_CACHE.clear()
+    yield
+    txt_processor._PROFILE_CACHE.clear()
+
+
+class TestTXTProfileCache:
+    @pytest.mark.asyncio
+    async def test_unchanged_file_reuses_profile(self, tmp_path):
+        """Test a second read of an unchanged file hits the profile cache."""
+        path = tmp_path / "notes.txt"
+        rewrite(path, "one two three", 1_000_000_000)
+
+        await TXTProcessor().extract_content(str(path))
+        await TXTProcessor().extract_content(str(path))
+
+        assert len(txt_processor._PROFILE_CACHE) == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_mtime_invalidates(self, tmp_path):
+        """Test a same-size rewrite with a new mtime is profiled again."""
+        path = tmp_path / "notes.txt"
+        rewrite(path, "one two three", 1_000_000_000)
+        _, before = await TXTProcessor().extract_content(str(path))
+
+        rewrite(path, "one-two-three", 2_000_000_000)
+        _, after = await TXTProcessor().extract_content(str(path))
+
+        assert before['word_count'] == 3
+        assert after['word_count'] == 1
+
+    @pytest.mark.asyncio
+    async def test_changed_size_invalidates(self, tmp_path):
+        """Test a rewrite that keeps the mtime but changes the size is profiled again."""
+        path = tmp_path / "notes.txt"
+        rewrite(path, "one two three", 1_000_000_000)
+        _, before = await TXTProcessor().extract_content(str(path))
+
+        rewrite(path, "one two three four", 1_000_000_000)
+        content, after = await TXTProcessor().extract_content(str(path))
+
+        assert before['word_count'] == 3
+        assert after['word_count'] == 4
+        assert content == "one two three four"
+
+
+class TestTXTStatistics:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("text", [
+        "", "one", "one\n", "one\ntwo", "one\n\ntwo\n",
+        "one\r\ntwo\rthree", "page\x0cbreak\x0bvtab", "one\u2028two\u2029three\x85four",
+    ])
+    async def test_line_count_matches_splitlines(self, text):
+        """Test raw text line counts match str.splitlines() for every line boundary."""
+        _, metadata = await TXTProcessor()._process_text(text)
+
+        assert metadata['line_count'] == len(text.splitlines())
@@ -4,18 +4,17 @@ Test Redis cache functionality
 """
 
 import asyncio
-import aioredis
 import json
 import sys
 import os
+import time
 from datetime import datetime
 
-async def test_redis_connection():
+from redis.asyncio import Redis
+
+async def test_redis_connection(redis_client):
     """Test Redis basic connection"""
     try:
-        redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
-        redis_client = aioredis.from_url(redis_url, decode_responses=True)
-        
         # Test basic operations
         await redis_client.ping()
         print("✅ Redis connection successful")
@@ -47,7 +46,6 @@ async def test_redis_connection():
         
         # Cleanup
         await redis_client.delete(test_key)
-        await redis_client.close()
         
         return True
         
@@ -55,12 +53,9 @@ async def test_redis_connection():
         print(f"❌ Redis connection failed: {e}")
         return False
 
-async def test_cache_patterns():
+async def test_cache_patterns(redis_client):
     """Test common cache patterns"""
     try:
-        redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
-        redis_client = aioredis.from_url(redis_url, decode_responses=True)
-        
         # Test query cache pattern
         query_key = "datalive:query:hash:test123"
         query_result = {
@@ -86,55 +81,56 @@ async def test_cache_patterns():
         await redis_client.setex(session_key, 1800, json.dumps(session_data))
         print("✅ Session cache pattern working")
         
-        # Test cache invalidation pattern
+        # Test cache invalidation pattern; SCAN walks the keyspace in steps
+        # instead of blocking Redis the way KEYS does
         pattern_key = "datalive:cache:*"
-        keys = await redis_client.keys(pattern_key)
+        keys = [key async for key in redis_client.scan_iter(match=pattern_key, count=500)]
         if keys:
             await redis_client.delete(*keys)
             print("✅ Cache invalidation pattern working")
         
-        await redis_client.close()
+        # Cleanup
+        await redis_client.delete(query_key, session_key)
+        
         return True
         
     except Exception as e:
         print(f"❌ Cache patterns test failed: {e}")
         return False
 
-async def test_performance():
+async def test_performance(redis_client):
     """Test Redis performance"""
     try:
-        redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
-        redis_client = aioredis.from_url(redis_url, decode_responses=True)
+        # Performance test - 100 operations, each phase sent as one pipeline
+        keys = [f"datalive:perf:test:{i}" for i in range(100)]
+        values = [json.dumps({"iteration": i, "data": "test" * 100}) for i in range(100)]
         
-        # Performance test - 100 operations
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
-        for i in range(100):
-            key = f"datalive:perf:test:{i}"
-            value = {"iteration": i, "data": "test" * 100}
-            await redis_client.setex(key, 300, json.dumps(value))
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key, value in zip(keys, values):
+                pipe.setex(key, 300, value)
+            await pipe.execute()
         
-        mid_time = datetime.now()
+        mid_time = time.perf_counter()
         
-        for i in range(100):
-            key = f"datalive:perf:test:{i}"
-            await redis_client.get(key)
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.get(key)
+            await pipe.execute()
         
-        end_time = datetime.now()
+        end_time = time.perf_counter()
         
-        write_time = (mid_time - start_time).total_seconds()
-        read_time = (end_time - mid_time).total_seconds()
+        write_time = mid_time - start_time
+        read_time = end_time - mid_time
         
         print(f"✅ Performance test completed:")
         print(f"   100 writes: {write_time:.3f}s ({100/write_time:.1f} ops/sec)")
         print(f"   100 reads: {read_time:.3f}s ({100/read_time:.1f} ops/sec)")
         
         # Cleanup
-        keys = await redis_client.keys("datalive:perf:test:*")
-        if keys:
-            await redis_client.delete(*keys)
+        await redis_client.delete(*keys)
         
-        await redis_client.close()
         return True
         
     except Exception as e:
@@ -155,17 +151,24 @@ async def main():
     passed = 0
     total = len(tests)
     
-    for test_name, test_func in tests:
-        print(f"\n🔍 Testing {test_name}...")
-        try:
-            result = await test_func()
-            if result:
-                passed += 1
-                print(f"✅ {test_name}: PASSED")
-            else:
-                print(f"❌ {test_name}: FAILED")
-        except Exception as e:
-            print(f"❌ {test_name}: ERROR - {e}")
+    # One client and connection pool shared by every test
+    redis_url = os.getenv("REDIS_URL", "redis://redis:6379")
+    redis_client = Redis.from_url(redis_url, decode_responses=True, max_connections=10)
+    
+    try:
+        for test_name, test_func in tests:
+            print(f"\n🔍 Testing {test_name}...")
+            try:
+                result = await test_func(redis_client)
+                if result:
+                    passed += 1
+                    print(f"✅ {test_name}: PASSED")
+                else:
+                    print(f"❌ {test_name}: FAILED")
+            except Exception as e:
+                print(f"❌ {test_name}: ERROR - {e}")
+    finally:
+        await redis_client.aclose()
     
     print("\n" + "=" * 40)
     print(f"🏆 Results: {passed}/{total} tests passed")
@@ -4,89 +4,312 @@ DataLive Python Test Suite
 Complementary to the bash script for more complex testing
 """
 
-import requests
+import aiohttp
+import argparse
 import json
 import time
 import os
+import statistics
 import sys
-from typing import Dict, List, Any, Optional
+import uuid
+from typing import Dict, List, Any, NamedTuple, Optional, Protocol, Tuple, Union
 import asyncio
-import concurrent.futures
+import functools
+from pathlib import Path
+from yarl import URL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+DRAIN_CHUNK_SIZE = 64 * 1024
+
+# Failures a probe reports as a failed test; anything else is a bug and propagates
+HTTP_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+if requests:
+    HTTP_ERRORS += (requests.RequestException,)
+if httpx:
+    HTTP_ERRORS += (httpx.HTTPError,)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, preferring orjson when installed"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode()
+
+
+loads = orjson.loads if orjson else json.loads
+
+# Over-length query for the error tests, encoded once per process
+LONG_QUERY_BODY = dumps({"query": "x" * 10_000})
+
+
+class TestResult(NamedTuple):
+    """Outcome of a single test"""
+    test_name: str
+    success: bool
+    duration: float
+    details: str
+    timestamp: float
+
+
+def requires_api_key(tests: str):
+    """Skip an async test, counting it as passed, when no API key is configured"""
+    def decorator(test):
+        @functools.wraps(test)
+        async def wrapper(self, *args, **kwargs):
+            if not self.api_key:
+                print(f"⚠️  No API key available, skipping {tests} tests")
+                return True
+            return await test(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+class Transport(Protocol):
+    """HTTP client backend; each keeps one keep-alive pool for the whole run"""
+    
+    async def request(
+        self,
+        method: str,
+        url: URL,
+        body: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+        timeout: float,
+        read_body: bool
+    ) -> Tuple[int, bytes]:
+        """Send a request, returning status and body (b"" unless read_body)"""
+        ...
+    
+    async def close(self):
+        """Release pooled connections"""
+        ...
+
+
+class AiohttpTransport:
+    """Native asyncio client; the default backend"""
+    
+    def __init__(self, headers: Optional[Dict[str, str]], connections: int):
+        connector = aiohttp.TCPConnector(limit=connections, keepalive_timeout=60)
+        self.session = aiohttp.ClientSession(connector=connector, headers=headers)
+    
+    async def request(self, method, url, body, headers, timeout, read_body):
+        async with self.session.request(
+            method,
+            url,
+            data=body,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout)
+        ) as response:
+            if read_body:
+                return response.status, await response.read()
+            
+            # Drain rather than close so the connection stays reusable
+            async for _ in response.content.iter_chunked(DRAIN_CHUNK_SIZE):
+                pass
+            return response.status, b""
+    
+    async def close(self):
+        await self.session.close()
+
+
+class RequestsTransport:
+    """Blocking requests.Session driven from worker threads"""
+    
+    def __init__(self, headers: Optional[Dict[str, str]], connections: int):
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=connections)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if headers:
+            self.session.headers.update(headers)
+    
+    def _send(self, method, url, body, headers, timeout, read_body):
+        with self.session.request(method, url, data=body, headers=headers,
+                                  timeout=timeout, stream=not read_body) as response:
+            if read_body:
+                return response.status_code, response.content
+            
+            for _ in response.iter_content(DRAIN_CHUNK_SIZE):
+                pass
+            return response.status_code, b""
+    
+    async def request(self, method, url, body, headers, timeout, read_body):
+        return await asyncio.to_thread(self._send, method, str(url), body, headers, timeout, read_body)
+    
+    async def close(self):
+        self.session.close()
+
+
+class HttpxTransport:
+    """httpx.AsyncClient over HTTP/1.1"""
+    
+    def __init__(self, headers: Optional[Dict[str, str]], connections: int):
+        limits = httpx.Limits(
+            max_connections=connections,
+            max_keepalive_connections=connections,
+            keepalive_expiry=60
+        )
+        self.client = httpx.AsyncClient(headers=headers, limits=limits)
+    
+    async def request(self, method, url, body, headers, timeout, read_body):
+        async with self.client.stream(method, str(url), content=body, headers=headers,
+                                      timeout=timeout) as response:
+            if read_body:
+                return response.status_code, await response.aread()
+            
+            async for _ in response.aiter_raw(DRAIN_CHUNK_SIZE):
+                pass
+            return response.status_code, b""
+    
+    async def close(self):
+        await self.client.aclose()
+
+
+# Backends selectable with --http-backend / DATALIVE_HTTP_BACKEND
+TRANSPORTS = {"aiohttp": AiohttpTransport}
+if requests:
+    TRANSPORTS["requests"] = RequestsTransport
+if httpx:
+    TRANSPORTS["httpx"] = HttpxTransport
 
 
 class DataLiveTestSuite:
     """Python-based test suite for DataLive system"""
     
-    def __init__(self):
+    CONCURRENT_REQUESTS = 5
+    INGEST_CONCURRENCY = 8
+    CACHE_TRIALS = 5
+    CACHE_SPEEDUP = 0.5  # Median hit must take at most half the median miss
+    REPORT_FILE = Path("/tmp/datalive-test-results/python-tests.json")
+    
+    ENDPOINTS = (
+        ("/health", "GET", None, "Health Check"),
+        ("/status", "GET", None, "Status Check"),
+        ("/docs", "GET", None, "Documentation"),
+        ("/metrics", "GET", None, "Metrics")
+    )
+    REQUIRED_QUERY_FIELDS = frozenset({'answer', 'confidence', 'strategy_used'})
+    
+    # Transient gateway errors are retried for idempotent methods only
+    RETRY_METHODS = frozenset({"GET", "HEAD"})
+    RETRY_STATUSES = frozenset({502, 503, 504})
+    MAX_RETRIES = 2
+    RETRY_BACKOFF = 0.1
+    
+    def __init__(self, http_backend: str = "aiohttp"):
         self.base_url = "http://datalive_agent:8058"
         self.api_key = os.getenv("DATALIVE_API_KEY")
-        self.session = requests.Session()
-        self.test_results = []
-        
-        # Set default headers
-        if self.api_key:
-            self.session.headers.update({"X-API-Key": self.api_key})
+        self.http_backend = http_backend
+        self.transport: Optional[Transport] = None  # opened by run_all_tests
+        self.test_results: List[TestResult] = []
+        self.REPORT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        self._urls: Dict[str, URL] = {}
+    
+    def _url(self, endpoint: str) -> URL:
+        """Full URL for an endpoint, parsed once per run"""
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = URL(f"{self.base_url}{endpoint}", encoded=True)
+        return url
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Union[Dict, bytes, None] = None,
+        timeout: float = 10,
+        read_body: bool = True
+    ) -> Tuple[int, bytes]:
+        """
+        Send one request on the shared transport, returning status and body.
+        Payloads may be passed pre-serialized to skip encoding on hot paths.
+        With read_body=False the body is drained in chunks and b"" returned,
+        so large responses such as /metrics are never held in memory.
+        """
+        if isinstance(payload, dict):
+            payload = dumps(payload)
+        headers = JSON_HEADERS if payload is not None else None
+        retries = self.MAX_RETRIES if method in self.RETRY_METHODS else 0
+        
+        for attempt in range(retries + 1):
+            status, body = await self.transport.request(
+                method, self._url(endpoint), payload, headers, timeout, read_body
+            )
+            if status not in self.RETRY_STATUSES or attempt == retries:
+                return status, body
+            
+            await asyncio.sleep(self.RETRY_BACKOFF * 2 ** attempt)
+    
+    async def _warm_up(self, connections: int = 1):
+        """
+        Open keep-alive connections with throwaway health checks so that
+        connection setup is not counted in timed requests.
+        """
+        try:
+            await asyncio.gather(*(self._request("GET", "/health", timeout=5, read_body=False)
+                                   for _ in range(connections)))
+        except HTTP_ERRORS:
+            pass  # The timed requests will report the failure
     
     def log_test_result(self, test_name: str, success: bool, duration: float, details: str = ""):
         """Log test result"""
-        result = {
-            'test_name': test_name,
-            'success': success,
-            'duration': duration,
-            'details': details,
-            'timestamp': time.time()
-        }
-        self.test_results.append(result)
+        self.test_results.append(TestResult(test_name, success, duration, details, time.time()))
         
         status = "✅ PASS" if success else "❌ FAIL"
         print(f"{status} {test_name} ({duration:.2f}s)")
         if details and not success:
             print(f"    Details: {details}")
     
-    def test_api_endpoints(self) -> bool:
+    async def test_api_endpoints(self) -> bool:
         """Test all API endpoints"""
         print("\n🔌 Testing API Endpoints...")
         
-        endpoints = [
-            ("/health", "GET", None, "Health Check"),
-            ("/status", "GET", None, "Status Check"),
-            ("/docs", "GET", None, "Documentation"),
-            ("/metrics", "GET", None, "Metrics")
-        ]
-        
-        all_passed = True
-        
-        for endpoint, method, payload, description in endpoints:
-            start_time = time.time()
+        async def check_endpoint(endpoint, method, payload, description) -> bool:
+            start_time = time.perf_counter()
             
             try:
-                if method == "GET":
-                    response = self.session.get(f"{self.base_url}{endpoint}", timeout=10)
-                else:
-                    response = self.session.post(f"{self.base_url}{endpoint}", json=payload, timeout=10)
+                status, _ = await self._request(method, endpoint, payload, read_body=False)
                 
-                success = response.status_code == 200
-                duration = time.time() - start_time
-                details = f"Status: {response.status_code}" if not success else ""
+                success = status == 200
+                duration = time.perf_counter() - start_time
+                details = f"Status: {status}" if not success else ""
                 
                 self.log_test_result(f"API {description}", success, duration, details)
-                all_passed &= success
+                return success
                 
-            except Exception as e:
-                duration = time.time() - start_time
+            except HTTP_ERRORS as e:
+                duration = time.perf_counter() - start_time
                 self.log_test_result(f"API {description}", False, duration, str(e))
-                all_passed = False
+                return False
         
-        return all_passed
+        results = await asyncio.gather(*(check_endpoint(*endpoint) for endpoint in self.ENDPOINTS))
+        return all(results)
     
-    def test_query_functionality(self) -> bool:
+    @requires_api_key("query")
+    async def test_query_functionality(self) -> bool:
         """Test query processing functionality"""
         print("\n🧠 Testing Query Functionality...")
         
-        if not self.api_key:
-            print("⚠️  No API key available, skipping query tests")
-            return True
-        
         test_queries = [
             ("What is DataLive?", "Basic Query"),
             ("Who developed DataLive?", "Entity Query"),
@@ -94,10 +317,8 @@ class DataLiveTestSuite:
             ("", "Empty Query"),  # Should handle gracefully
         ]
         
-        all_passed = True
-        
-        for query, description in test_queries:
-            start_time = time.time()
+        async def check_query(query, description) -> bool:
+            start_time = time.perf_counter()
             
             try:
                 payload = {
@@ -106,146 +327,147 @@ class DataLiveTestSuite:
                     "use_cache": True
                 }
                 
-                response = self.session.post(
-                    f"{self.base_url}/api/v1/query",
-                    json=payload,
-                    timeout=30
-                )
+                status, body = await self._request("POST", "/api/v1/query", payload, timeout=30)
                 
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
-                if response.status_code == 200:
-                    data = response.json()
+                if status == 200:
+                    data = loads(body)
                     # Check response structure
-                    required_fields = ['answer', 'confidence', 'strategy_used']
-                    success = all(field in data for field in required_fields)
+                    success = self.REQUIRED_QUERY_FIELDS <= data.keys()
                     details = f"Response fields: {list(data.keys())}" if not success else ""
                 else:
                     success = query == ""  # Empty query should fail
-                    details = f"Status: {response.status_code}"
+                    details = f"Status: {status}"
                 
                 self.log_test_result(f"Query {description}", success, duration, details)
-                all_passed &= success
+                return success
                 
-            except Exception as e:
-                duration = time.time() - start_time
+            except (*HTTP_ERRORS, ValueError) as e:  # ValueError: malformed JSON
+                duration = time.perf_counter() - start_time
                 self.log_test_result(f"Query {description}", False, duration, str(e))
-                all_passed = False
+                return False
         
-        return all_passed
+        results = await asyncio.gather(*(check_query(*test_query) for test_query in test_queries))
+        return all(results)
     
-    def test_ingestion_functionality(self) -> bool:
+    @requires_api_key("ingestion")
+    async def test_ingestion_functionality(self) -> bool:
         """Test document ingestion"""
         print("\n📄 Testing Ingestion Functionality...")
         
-        if not self.api_key:
-            print("⚠️  No API key available, skipping ingestion tests")
-            return True
-        
         test_documents = [
             ("txt", "This is a test document for automated testing.", "Text Ingestion"),
             ("md", "# Test Document\n\nThis is a **markdown** test document.", "Markdown Ingestion"),
         ]
         
-        all_passed = True
+        # Bound in-flight ingestions so larger corpora do not flood the agent
+        slots = asyncio.Semaphore(self.INGEST_CONCURRENCY)
         
-        for source_type, content, description in test_documents:
-            start_time = time.time()
-            
-            try:
-                payload = {
-                    "source_type": source_type,
-                    "source": content,
-                    "metadata": {
-                        "test_document": True,
-                        "created_by": "automated_test"
+        async def ingest(source_type, content, description) -> bool:
+            async with slots:
+                start_time = time.perf_counter()
+                
+                try:
+                    payload = {
+                        "source_type": source_type,
+                        "source": content,
+                        "metadata": {
+                            "test_document": True,
+                            "created_by": "automated_test"
+                        }
                     }
-                }
                 
-                response = self.session.post(
-                    f"{self.base_url}/api/v1/ingest",
-                    json=payload,
-                    timeout=30
-                )
+                    status, body = await self._request("POST", "/api/v1/ingest", payload, timeout=30)
                 
-                duration = time.time() - start_time
-                success = response.status_code == 200
-                details = f"Status: {response.status_code}" if not success else ""
+                    duration = time.perf_counter() - start_time
+                    success = status == 200
+                    details = f"Status: {status}" if not success else ""
                 
-                if success and response.status_code == 200:
-                    data = response.json()
-                    success = 'document_id' in data or 'success' in data
+                    if success and status == 200:
+                        data = loads(body)
+                        success = 'document_id' in data or 'success' in data
                 
-                self.log_test_result(f"Ingestion {description}", success, duration, details)
-                all_passed &= success
+                    self.log_test_result(f"Ingestion {description}", success, duration, details)
+                    return success
                 
-            except Exception as e:
-                duration = time.time() - start_time
-                self.log_test_result(f"Ingestion {description}", False, duration, str(e))
-                all_passed = False
+                except (*HTTP_ERRORS, ValueError) as e:  # ValueError: malformed JSON
+                    duration = time.perf_counter() - start_time
+                    self.log_test_result(f"Ingestion {description}", False, duration, str(e))
+                    return False
         
-        return all_passed
+        results = await asyncio.gather(*(ingest(*document) for document in test_documents))
+        return all(results)
     
-    def test_cache_performance(self) -> bool:
+    @requires_api_key("cache")
+    async def test_cache_performance(self) -> bool:
         """Test cache performance"""
         print("\n⚡ Testing Cache Performance...")
         
-        if not self.api_key:
-            print("⚠️  No API key available, skipping cache tests")
-            return True
+        await self._warm_up()
         
-        test_query = "Cache performance test query"
-        payload = {
-            "query": test_query,
-            "use_cache": True
-        }
+        # Unique queries so every first request is a miss, even across runs
+        run_id = uuid.uuid4().hex[:8]
+        payloads = [
+            dumps({
+                "query": f"Cache performance test query {run_id}-{trial}",
+                "use_cache": True
+            })
+            for trial in range(self.CACHE_TRIALS)
+        ]
+        first_times = []
+        second_times = []
         
-        # First request (cache miss)
-        start_time = time.time()
         try:
-            response1 = self.session.post(f"{self.base_url}/api/v1/query", json=payload, timeout=30)
-            first_duration = time.time() - start_time
-            
-            # Second request (cache hit)
-            start_time = time.time()
-            response2 = self.session.post(f"{self.base_url}/api/v1/query", json=payload, timeout=30)
-            second_duration = time.time() - start_time
+            for payload in payloads:
+                # First request (cache miss)
+                start_time = time.perf_counter()
+                status1, _ = await self._request("POST", "/api/v1/query", payload, timeout=30,
+                                                    read_body=False)
+                first_times.append(time.perf_counter() - start_time)
+                
+                # Second request (cache hit)
+                start_time = time.perf_counter()
+                status2, _ = await self._request("POST", "/api/v1/query", payload, timeout=30,
+                                                    read_body=False)
+                second_times.append(time.perf_counter() - start_time)
+                
+                if status1 != 200 or status2 != 200:
+                    self.log_test_result("Cache Performance", False, second_times[-1], "API requests failed")
+                    return False
             
-            if response1.status_code == 200 and response2.status_code == 200:
-                # Cache should make second request faster
-                performance_improvement = first_duration > second_duration
-                self.log_test_result("Cache Performance", performance_improvement, second_duration,
-                                   f"First: {first_duration:.2f}s, Second: {second_duration:.2f}s")
-                return performance_improvement
-            else:
-                self.log_test_result("Cache Performance", False, second_duration, "API requests failed")
-                return False
+            # Medians keep a single jittery trial from deciding the result
+            first_median = statistics.median(first_times)
+            second_median = statistics.median(second_times)
+            performance_improvement = second_median < self.CACHE_SPEEDUP * first_median
+            self.log_test_result("Cache Performance", performance_improvement, second_median,
+                               f"First: {first_median:.2f}s, Second: {second_median:.2f}s "
+                               f"(median of {self.CACHE_TRIALS}, "
+                               f"hit/miss ratio {second_median / first_median:.2f})")
+            return performance_improvement
                 
-        except Exception as e:
+        except HTTP_ERRORS as e:
             self.log_test_result("Cache Performance", False, 0, str(e))
             return False
     
-    def test_concurrent_requests(self) -> bool:
+    @requires_api_key("concurrent")
+    async def test_concurrent_requests(self) -> bool:
         """Test concurrent request handling"""
         print("\n🔄 Testing Concurrent Requests...")
         
-        if not self.api_key:
-            print("⚠️  No API key available, skipping concurrent tests")
-            return True
-        
-        def make_request(query_id: int) -> Dict:
+        async def make_request(query_id: int, body: bytes) -> Dict:
             """Make a single request"""
             try:
-                payload = {"query": f"Concurrent test query {query_id}"}
-                start_time = time.time()
-                response = self.session.post(f"{self.base_url}/api/v1/query", json=payload, timeout=30)
-                duration = time.time() - start_time
+                start_time = time.perf_counter()
+                status, _ = await self._request("POST", "/api/v1/query", body, timeout=30,
+                                                   read_body=False)
+                duration = time.perf_counter() - start_time
                 return {
                     'id': query_id,
-                    'success': response.status_code == 200,
+                    'success': status == 200,
                     'duration': duration
                 }
-            except Exception as e:
+            except HTTP_ERRORS as e:
                 return {
                     'id': query_id,
                     'success': False,
@@ -253,65 +475,65 @@ class DataLiveTestSuite:
                     'error': str(e)
                 }
         
-        # Run 5 concurrent requests
-        start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(make_request, i) for i in range(5)]
-            results = [future.result() for future in concurrent.futures.as_completed(futures)]
+        # All requests in flight at once on the shared session
+        count = self.CONCURRENT_REQUESTS
+        await self._warm_up(count)
+        bodies = [dumps({"query": f"Concurrent test query {i}"}) for i in range(count)]
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(make_request(i, body) for i, body in enumerate(bodies)))
         
-        total_duration = time.time() - start_time
+        total_duration = time.perf_counter() - start_time
         
         successful_requests = sum(1 for r in results if r['success'])
-        success = successful_requests >= 4  # At least 80% success rate
+        success = successful_requests >= 0.8 * count  # At least 80% success rate
         
         self.log_test_result("Concurrent Requests", success, total_duration,
-                           f"{successful_requests}/5 requests successful")
+                           f"{successful_requests}/{count} requests successful")
         
         return success
     
-    def test_error_handling(self) -> bool:
+    async def test_error_handling(self) -> bool:
         """Test error handling"""
         print("\n🛡️  Testing Error Handling...")
         
         test_cases = [
-            ("/api/v1/query", {"query": "x" * 10000}, "Very Long Query"),  # Should be rejected
+            ("/api/v1/query", LONG_QUERY_BODY, "Very Long Query"),  # Should be rejected
             ("/api/v1/query", {}, "Missing Query Field"),  # Should be rejected
             ("/api/v1/ingest", {"source_type": "invalid"}, "Invalid Source Type"),  # Should be rejected
             ("/nonexistent", {}, "Nonexistent Endpoint"),  # Should return 404
         ]
         
-        all_passed = True
-        
-        for endpoint, payload, description in test_cases:
-            start_time = time.time()
+        async def check_error(endpoint, payload, description) -> bool:
+            start_time = time.perf_counter()
             
             try:
-                response = self.session.post(f"{self.base_url}{endpoint}", json=payload, timeout=10)
-                duration = time.time() - start_time
+                status, _ = await self._request("POST", endpoint, payload, read_body=False)
+                duration = time.perf_counter() - start_time
                 
                 # These should all fail gracefully (not 5xx errors)
-                success = response.status_code in [400, 404, 422]  # Client errors, not server errors
-                details = f"Status: {response.status_code}"
+                success = status in [400, 404, 422]  # Client errors, not server errors
+                details = f"Status: {status}"
                 
                 self.log_test_result(f"Error Handling {description}", success, duration, details)
-                all_passed &= success
+                return success
                 
-            except Exception as e:
-                duration = time.time() - start_time
+            except HTTP_ERRORS as e:
+                duration = time.perf_counter() - start_time
                 self.log_test_result(f"Error Handling {description}", False, duration, str(e))
-                all_passed = False
+                return False
         
-        return all_passed
+        results = await asyncio.gather(*(check_error(*test_case) for test_case in test_cases))
+        return all(results)
     
     def generate_report(self) -> Dict:
         """Generate comprehensive test report"""
         total_tests = len(self.test_results)
-        passed_tests = sum(1 for r in self.test_results if r['success'])
+        passed_tests = sum(1 for r in self.test_results if r.success)
         failed_tests = total_tests - passed_tests
         
         if total_tests > 0:
             success_rate = (passed_tests / total_tests) * 100
-            avg_duration = sum(r['duration'] for r in self.test_results) / total_tests
+            avg_duration = sum(r.duration for r in self.test_results) / total_tests
         else:
             success_rate = 0
             avg_duration = 0
@@ -322,8 +544,9 @@ class DataLiveTestSuite:
             'failed_tests': failed_tests,
             'success_rate': success_rate,
             'average_duration': avg_duration,
+            'http_backend': self.http_backend,
             'timestamp': time.time(),
-            'results': self.test_results
+            'results': [r._asdict() for r in self.test_results]
         }
         
         print(f"\n{'='*50}")
@@ -334,39 +557,68 @@ class DataLiveTestSuite:
         print(f"Failed: {failed_tests} ❌")
         print(f"Success Rate: {success_rate:.1f}%")
         print(f"Average Duration: {avg_duration:.2f}s")
+        print(f"HTTP Backend: {self.http_backend}")
         
         return report
     
-    def run_all_tests(self) -> bool:
+    async def run_all_tests(self) -> bool:
         """Run all tests"""
         print("🐍 DataLive Python Test Suite Starting...")
         
         all_passed = True
         
-        # Run all test categories
-        all_passed &= self.test_api_endpoints()
-        all_passed &= self.test_query_functionality()
-        all_passed &= self.test_ingestion_functionality()
-        all_passed &= self.test_cache_performance()
-        all_passed &= self.test_concurrent_requests()
-        all_passed &= self.test_error_handling()
+        # One keep-alive connection pool for every test, never with fewer
+        # slots than the concurrent test keeps in flight
+        headers = {"X-API-Key": self.api_key} if self.api_key else None
+        self.transport = TRANSPORTS[self.http_backend](headers, max(32, self.CONCURRENT_REQUESTS))
+        try:
+            # Independent categories overlap their network waits
+            results = await asyncio.gather(
+                self.test_api_endpoints(),
+                self.test_query_functionality(),
+                self.test_ingestion_functionality(),
+                self.test_error_handling(),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    print(f"❌ Test category crashed: {result!r}")
+            all_passed = all(result is True for result in results)
+            
+            # Timing-sensitive tests run alone so they do not contend
+            all_passed &= await self.test_cache_performance()
+            all_passed &= await self.test_concurrent_requests()
+        finally:
+            await self.transport.close()
         
         # Generate final report
         report = self.generate_report()
         
-        # Save report to file
-        report_file = "/tmp/datalive-test-results/python-tests.json"
-        os.makedirs(os.path.dirname(report_file), exist_ok=True)
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Save report to file off the event loop
+        await asyncio.to_thread(self.REPORT_FILE.write_bytes, dumps(report, indent=True))
         
         return all_passed
 
 
 def main():
     """Main entry point"""
-    test_suite = DataLiveTestSuite()
-    success = test_suite.run_all_tests()
+    parser = argparse.ArgumentParser(description="DataLive Python Test Suite")
+    parser.add_argument(
+        "--http-backend",
+        default=os.getenv("DATALIVE_HTTP_BACKEND", "aiohttp"),
+        help=f"HTTP client to drive the tests with: {', '.join(TRANSPORTS)} "
+             "(default: $DATALIVE_HTTP_BACKEND or aiohttp)"
+    )
+    args = parser.parse_args()
+    if args.http_backend not in TRANSPORTS:
+        parser.error(f"HTTP backend {args.http_backend!r} is not available; "
+                     f"choose from {', '.join(TRANSPORTS)}")
+    
+    if uvloop:
+        uvloop.install()
+    
+    test_suite = DataLiveTestSuite(args.http_backend)
+    success = asyncio.run(test_suite.run_all_tests())
     sys.exit(0 if success else 1)
 
 